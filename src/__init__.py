@@ -1,5 +1,12 @@
 """Pipeline helpers package."""
 
-from src.helpers import git_helper, release_helper
+import importlib
 
 __all__ = ["git_helper", "release_helper"]
+
+
+def __getattr__(name):
+    # Helper modules pull in GitPython and requests, so only import them when asked for
+    if name in __all__:
+        return importlib.import_module(f"src.helpers.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,37 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import os
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.helpers.argparse_helper import CustomHelpFormatter, HelpfulArgumentParser
-from src.helpers.concourse import ConcourseClient
 from src.helpers.error_handler import wrap_main
-from src.helpers.git_helper import GitHelper
+from src.helpers.lazy_import import LazyImports
 from src.helpers.logger import default_logger as logger
 from src.helpers.path_helper import RepositoryPathHelper
-from src.helpers.release_helper import ReleaseHelper
 
-
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
+if TYPE_CHECKING:
+    from src.helpers.concourse import ConcourseClient
+    from src.helpers.git_helper import GitHelper
+    from src.helpers.release_helper import ReleaseHelper
+
+_lazy_imports = LazyImports(
+    globals(),
+    {
+        "ConcourseClient": "src.helpers.concourse",
+        "GitHelper": "src.helpers.git_helper",
+        "ReleaseHelper": "src.helpers.release_helper",
+    },
+)
+__getattr__ = _lazy_imports
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> HelpfulArgumentParser:
+    """Build the argument parser once; parsing keeps no state on the parser."""
     parser = HelpfulArgumentParser(
         prog="create_release.py",
         description="Create a new release",
@@ -68,7 +84,6 @@ Options:
         "-w",
         "--git-dir",
         "--workspace",
-        default=os.environ.get("GIT_WORKSPACE", str(Path.home() / "git")),
         type=str,
         help=argparse.SUPPRESS,
     )
@@ -83,13 +98,48 @@ Options:
         action="help",
         help="display usage",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv[1:] when None.
+    """
+    args = _build_parser().parse_args(argv)
+    if args.git_dir is None:
+        # Read on every parse, as the parser is built once per process
+        args.git_dir = os.environ.get("GIT_WORKSPACE", str(Path.home() / "git"))
+    return args
+
+
+def confirm_follow_up_steps() -> Tuple[bool, bool]:
+    """Ask whether to trigger prepare-kustomizations and run fly.sh in a single prompt.
+
+    The answer is one y or n per step, in order. An empty answer skips both steps.
+
+    Returns:
+        Whether to trigger the prepare-kustomizations job and whether to run fly.sh
+    """
+    while True:
+        answers = input("Trigger prepare-kustomizations job and run fly.sh? [yy/yn/ny/NN] ")
+        answers = answers.strip().lower() or "nn"
+        if len(answers) == 2 and set(answers) <= {"y", "n"}:
+            return answers[0] == "y", answers[1] == "y"
+        logger.error("Please answer with y or n for each step, e.g. yn")
 
 
 @wrap_main
-def main() -> None:
-    """Main function to create a new release."""
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main function to create a new release.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv[1:] when None, which lets tests
+            drive the script in-process instead of spawning the console entry point.
+    """
+    args = parse_args(argv)
+    _lazy_imports.load()
 
     repo = args.repo
     params_repo = args.params_repo
@@ -107,18 +157,11 @@ def main() -> None:
     logger.info(f"Creating release for repo: {repo}")
     logger.info(f"Foundation: {foundation}")
 
-    repo_dir = os.path.join(git_dir, repo)
-    params_dir = os.path.join(git_dir, params_repo)
     path_helper = RepositoryPathHelper(git_dir=git_dir, owner=owner)
     repo, repo_dir, params_repo, params_dir = path_helper.adjust_paths(repo, params_repo)
+    ci_dir = os.path.join(repo_dir, "ci")
 
-    release_pipeline = f"tkgi-{repo}-release"
-    set_pipeline = f"tkgi-{repo}-{foundation}-set-release-pipeline"
-    mgmt_pipeline = f"tkgi-{repo}-{foundation}"
-    if owner != "Utilities-tkgieng":
-        release_pipeline = f"tkgi-{repo}-{owner}-release"
-        set_pipeline = f"tkgi-{repo}-{owner}-{foundation}-set-release-pipeline"
-        mgmt_pipeline = f"tkgi-{repo}-{owner}-{foundation}"
+    release_pipeline, set_pipeline, mgmt_pipeline = path_helper.pipeline_names(repo, foundation)
     logger.info(f"Using release pipeline: {release_pipeline}")
     logger.info(f"Using set pipeline: {set_pipeline}")
     logger.info(f"Using mgmt pipeline: {mgmt_pipeline}")
@@ -130,39 +173,37 @@ def main() -> None:
     logger.info(f"Using owner: {owner}")
 
     # Initialize helpers
-    concourse_client = ConcourseClient()
-    release_helper = ReleaseHelper(
-        foundation=foundation,
-        repo=repo,
-        git_dir=git_dir,
-        repo_dir=repo_dir,
-        owner=owner,
-        params_dir=params_dir,
-        params_repo=params_repo,
-        release_pipeline=release_pipeline,
-        set_pipeline=set_pipeline,
-        mgmt_pipeline=mgmt_pipeline,
-    )
     git_helper = GitHelper(
         git_dir=git_dir, repo=repo, repo_dir=repo_dir, params=params_repo, params_dir=params_dir
     )
     if not git_helper.check_git_repo():
         raise ValueError(f"{repo} is not a git repository")
 
-    # Change to the repo's ci directory
-    ci_dir = os.path.join(git_dir, repo, "ci")
+    # fly commands are run from the repo's ci directory
     if not os.path.exists(ci_dir):
         raise ValueError(f"CI directory not found at {ci_dir}")
 
     if dry_run:
         logger.info("DRY RUN MODE - No changes will be made")
-        logger.info(f"Would change to directory: {ci_dir}")
+        logger.info(f"Would run fly commands from directory: {ci_dir}")
         logger.info(f"Would run release pipeline: {release_pipeline}")
         logger.info("Would update git release tag")
         return
-    else:
-        os.chdir(ci_dir)
-        logger.info(f"Changed to directory: {ci_dir}")
+
+    # The fly CLI and GitHub token are only needed once we leave dry-run mode
+    concourse_client = ConcourseClient()
+    release_helper = ReleaseHelper(
+        foundation=foundation,
+        repo=repo,
+        git_dir=git_dir,
+        repo_dir=repo_dir,
+        owner=owner,
+        params_dir=params_dir,
+        params_repo=params_repo,
+        release_pipeline=release_pipeline,
+        set_pipeline=set_pipeline,
+        mgmt_pipeline=mgmt_pipeline,
+    )
 
     # Run release pipeline
     if not release_helper.run_release_pipeline(foundation, message):
@@ -176,16 +217,18 @@ def main() -> None:
     if not release_helper.run_set_pipeline(foundation):
         raise ValueError("Failed to run set pipeline")
 
-    # Ask user if they want to trigger a job
-    trigger_response = input("Do you want to trigger a prepare-kustomizations job? [y/N] ")
-    if trigger_response.lower().startswith("y"):
+    trigger_job, run_fly_script = confirm_follow_up_steps()
+
+    if not trigger_job:
+        logger.info("Skipping the prepare-kustomizations job")
+    else:
         concourse_client.trigger_job(
-            foundation, f"tkgi-{repo}-{foundation}/prepare-kustomizations", watch=True
+            foundation, f"{mgmt_pipeline}/prepare-kustomizations", watch=True
         )
 
-    # Ask user if they want to run fly.sh script
-    fly_script_response = input("Do you want to run the fly.sh script? [y/N] ")
-    if fly_script_response.lower().startswith("y"):
+    if not run_fly_script:
+        logger.info("Skipping fly.sh")
+    else:
         # Get current branch
         current_branch = git_helper.get_current_branch()
         # Build the path to fly.sh
@@ -199,6 +242,7 @@ def main() -> None:
                 "-b",
                 current_branch,
             ],
+            cwd=ci_dir,
             check=True,
         )
 
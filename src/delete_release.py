@@ -2,13 +2,34 @@
 
 import argparse
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.helpers.argparse_helper import CustomHelpFormatter, HelpfulArgumentParser
-from src.helpers.git_helper import GitHelper
+from src.helpers.lazy_import import LazyImports
 from src.helpers.logger import default_logger as logger
 from src.helpers.path_helper import RepositoryPathHelper
-from src.helpers.release_helper import ReleaseHelper
+
+if TYPE_CHECKING:
+    from src.helpers.git_helper import GitHelper
+    from src.helpers.release_helper import ReleaseHelper
+
+_lazy_imports = LazyImports(
+    globals(),
+    {
+        "GitHelper": "src.helpers.git_helper",
+        "ReleaseHelper": "src.helpers.release_helper",
+    },
+)
+__getattr__ = _lazy_imports
+
+MAX_CONCURRENT_DELETES = 8
+
+# GitHub release tags are never bare commit SHAs
+COMMIT_SHA_PATTERN = re.compile(r"[0-9a-f]{40}")
 
 
 def parse_args() -> argparse.Namespace:
@@ -18,11 +39,12 @@ def parse_args() -> argparse.Namespace:
         description="Delete a GitHub release",
         formatter_class=CustomHelpFormatter,
         add_help=False,
-        usage="%(prog)s -r repo -t tag [-o owner] [-x] [-n] [-h]",
+        usage="%(prog)s -r repo -t tag [tag ...] [-o owner] [-x] [-n] [-h]",
         epilog="""
 Options:
   -r repo          the repo to use
-  -t tag           the release tag (e.g.: v1.0.0)
+  -t tag [tag ...] the release tag(s) to delete (e.g.: v1.0.0 v1.1.0)
+                   a 40 character commit SHA skips the GitHub release lookup
   -o owner         the github owner (default: Utilities-tkgieng)
   -x               do not delete the git tag
   -n               non-interactive
@@ -40,6 +62,7 @@ Options:
         "-t",
         "--tag",
         "--release-tag",
+        nargs="+",
         required=True,
         help=argparse.SUPPRESS,
     )
@@ -78,19 +101,32 @@ Options:
     return parser.parse_args()
 
 
-def delete_git_tag(
-    git_helper: GitHelper, release_helper: ReleaseHelper, tag: str, non_interactive: bool = False
-) -> None:
-    """Delete a git tag with user confirmation if needed."""
+def confirm_git_tag_deletion(
+    git_helper: "GitHelper",
+    tag: str,
+    non_interactive: bool = False,
+) -> bool:
+    """Check a git tag exists and confirm it should be deleted if needed."""
     if not git_helper.tag_exists(tag):
         logger.error(f"Git tag {tag} not found in repository")
-        return
+        return False
 
     if not non_interactive:
         user_input = input(f"Would you like to delete the git tag: {tag}? [yN] ")
         if not user_input.lower().startswith("y"):
-            return
-    release_helper.delete_release_tag(tag)
+            return False
+    return True
+
+
+def delete_git_tag(
+    git_helper: "GitHelper",
+    release_helper: "ReleaseHelper",
+    tag: str,
+    non_interactive: bool = False,
+) -> None:
+    """Delete a git tag with user confirmation if needed."""
+    if confirm_git_tag_deletion(git_helper, tag, non_interactive):
+        release_helper.delete_release_tag(tag)
 
 
 def print_available_releases(releases: list) -> None:
@@ -100,12 +136,103 @@ def print_available_releases(releases: list) -> None:
         print(f"{release['tag_name']} - {release['name']}")
 
 
+def confirm_release_deletion(
+    git_helper: "GitHelper",
+    release_helper: "ReleaseHelper",
+    release_tag: str,
+    no_tag_deletion: bool = False,
+    non_interactive: bool = False,
+) -> Tuple[Optional[dict], bool]:
+    """Look up the GitHub release for a tag and confirm it should be deleted.
+
+    When no release exists for the tag, the git tag is offered for deletion on its own.
+
+    Returns:
+        The release to delete, or None if there is nothing to delete or the user declined,
+        and whether the git tag of a tag without a release should be deleted
+    """
+    if COMMIT_SHA_PATTERN.fullmatch(release_tag):
+        logger.info(f"{release_tag} is a commit SHA, skipping GitHub release lookup")
+        delete_tag = not no_tag_deletion and confirm_git_tag_deletion(
+            git_helper, release_tag, non_interactive
+        )
+        return None, delete_tag
+
+    release = release_helper.get_github_release_by_tag(release_tag)
+
+    if not release:
+        # Only list releases on a miss, so the user can see which tags do exist
+        releases = release_helper.get_releases()
+        if not releases:
+            logger.info("No releases found")
+        else:
+            logger.error(f"Release {release_tag} not found")
+            print_available_releases(releases)
+        delete_tag = not no_tag_deletion and confirm_git_tag_deletion(
+            git_helper, release_tag, non_interactive
+        )
+        return None, delete_tag
+
+    if not non_interactive:
+        user_input = input(f"Are you sure you want to delete github release: {release_tag}? [yN] ")
+        if not user_input.lower().startswith("y"):
+            return None, False
+    return release, False
+
+
+def delete_releases(
+    git_helper: "GitHelper",
+    release_helper: "ReleaseHelper",
+    release_tags: List[str],
+    no_tag_deletion: bool = False,
+    non_interactive: bool = False,
+) -> None:
+    """Confirm and delete the GitHub releases, and their git tags, for the given tags.
+
+    The confirmed git tags are deleted together at the end, with a single push to origin.
+    """
+    releases = {}
+    tags_to_delete = []
+    for release_tag in release_tags:
+        release, delete_tag = confirm_release_deletion(
+            git_helper,
+            release_helper,
+            release_tag,
+            no_tag_deletion=no_tag_deletion,
+            non_interactive=non_interactive,
+        )
+        if release:
+            releases[release_tag] = release
+        elif delete_tag:
+            tags_to_delete.append(release_tag)
+
+    # Each delete is an independent API call, so issue them concurrently
+    release_ids = [release.get("id") for release in releases.values()]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DELETES) as executor:
+        results = list(executor.map(release_helper.delete_github_release, release_ids))
+
+    for release_tag, deleted in zip(releases, results):
+        if not deleted:
+            logger.error("Failed to delete GitHub release")
+
+        if not no_tag_deletion and confirm_git_tag_deletion(
+            git_helper, release_tag, non_interactive
+        ):
+            tags_to_delete.append(release_tag)
+
+        logger.info(f"Deleted GitHub release: {release_tag}")
+
+    if tags_to_delete:
+        release_helper.delete_release_tags(tags_to_delete)
+
+
 def main() -> None:
-    """Main function to delete a GitHub release."""
+    """Main function to delete one or more GitHub releases."""
     args = parse_args()
+    _lazy_imports.load()
     repo = args.repo
     owner = args.owner
-    release_tag = args.tag
+    release_tags = args.tag
     git_dir = args.git_dir
 
     path_helper = RepositoryPathHelper(git_dir=git_dir, owner=owner)
@@ -118,38 +245,19 @@ def main() -> None:
         repo_dir=repo_dir,
         owner=owner,
     )
-    git_helper = GitHelper(git_dir=git_dir, repo=repo, repo_dir=repo_dir)
-    if not git_helper.check_git_repo():
-        logger.error(f"{repo} is not a git repository")
-        return
-
-    release = release_helper.get_github_release_by_tag(release_tag)
-
-    if not release:
-        releases = release_helper.get_releases()
-        if not releases:
-            logger.info("No releases found")
-            if not args.no_tag_deletion:
-                delete_git_tag(git_helper, release_helper, release_tag, args.non_interactive)
+    with closing(release_helper):
+        git_helper = GitHelper(git_dir=git_dir, repo=repo, repo_dir=repo_dir)
+        if not git_helper.check_git_repo():
+            logger.error(f"{repo} is not a git repository")
             return
-        logger.error(f"Release {release_tag} not found")
-        print_available_releases(releases)
-        if not args.no_tag_deletion:
-            delete_git_tag(git_helper, release_helper, release_tag, args.non_interactive)
-        return
-
-    if not args.non_interactive:
-        user_input = input(f"Are you sure you want to delete github release: {release_tag}? [yN] ")
-        if not user_input.lower().startswith("y"):
-            return
-
-    if not release_helper.delete_github_release(release.get("id")):
-        logger.error("Failed to delete GitHub release")
-
-    if not args.no_tag_deletion:
-        delete_git_tag(git_helper, release_helper, release_tag, args.non_interactive)
 
-    logger.info(f"Deleted GitHub release: {release_tag}")
+        delete_releases(
+            git_helper,
+            release_helper,
+            release_tags,
+            no_tag_deletion=args.no_tag_deletion,
+            non_interactive=args.non_interactive,
+        )
 
 
 if __name__ == "__main__":
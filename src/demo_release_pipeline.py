@@ -5,16 +5,43 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from src.helpers.argparse_helper import CustomHelpFormatter, HelpfulArgumentParser
-from src.helpers.concourse import ConcourseClient
 from src.helpers.error_handler import wrap_main
-from src.helpers.git_helper import GitHelper
+from src.helpers.lazy_import import LazyImports
 from src.helpers.logger import default_logger as logger
 from src.helpers.path_helper import RepositoryPathHelper
-from src.helpers.release_helper import ReleaseHelper
+
+if TYPE_CHECKING:
+    from src.helpers.concourse import ConcourseClient
+    from src.helpers.git_helper import GitBatchCheck, GitHelper, git_executable
+    from src.helpers.release_helper import ReleaseHelper
+
+_lazy_imports = LazyImports(
+    globals(),
+    {
+        "ConcourseClient": "src.helpers.concourse",
+        "GitBatchCheck": "src.helpers.git_helper",
+        "GitHelper": "src.helpers.git_helper",
+        "ReleaseHelper": "src.helpers.release_helper",
+        "git_executable": "src.helpers.git_helper",
+    },
+)
+__getattr__ = _lazy_imports
+
+_SEMVER_RE = re.compile(r"\d+\.\d+\.\d+")
+
+# How many of the newest release tags to show when an unknown version is entered
+_MAX_LISTED_TAGS = 20
+
+
+def _confirm(prompt: str) -> bool:
+    """Ask a yes/no question; any answer starting with y or Y counts as yes."""
+    return input(prompt)[:1] in ("y", "Y")
 
 
 class DemoReleasePipeline:
@@ -22,9 +49,9 @@ class DemoReleasePipeline:
 
     def __init__(
         self,
-        git_helper: GitHelper,
-        release_helper: ReleaseHelper,
-        concourse_client: ConcourseClient,
+        git_helper: "GitHelper",
+        release_helper: "ReleaseHelper",
+        concourse_client: "ConcourseClient",
         foundation: str,
         repo: str,
         repo_dir: str,
@@ -40,6 +67,8 @@ class DemoReleasePipeline:
         mgmt_pipeline: str,
         dry_run: bool = False,
     ):
+        # The methods below use the deferred helpers as module globals
+        _lazy_imports.load()
         self.git_helper = git_helper
         self.release_helper = release_helper
         self.concourse_client = concourse_client
@@ -52,16 +81,27 @@ class DemoReleasePipeline:
         self.owner = owner
         self.repo = repo
         self.repo_dir = repo_dir
+        # Paths inside the repo that the pipeline writes to or runs from
+        self._version_file = Path(repo_dir, "version")
+        self._ci_dir = os.path.join(repo_dir, "ci")
         self.params_repo = params_repo
         self.params_dir = params_dir
-        self.release_pipeline = (release_pipeline,)
-        self.set_pipeline = (set_pipeline,)
-        self.mgmt_pipeline = (mgmt_pipeline,)
+        # Pipeline names already include the owner suffix, so they are used as given
+        self.release_pipeline = release_pipeline
+        self.set_release_pipeline = set_pipeline
+        self.mgmt_pipeline = mgmt_pipeline
 
         self.github_token = os.getenv("GITHUB_TOKEN")
         if not self.github_token:
             raise ValueError("GITHUB_TOKEN env must be set before executing this script")
 
+        # Lookups repeated by the interactive prompts: the release tags, newest first,
+        # and the GitHub releases keyed by tag
+        self._release_tags: Optional[List[str]] = None
+        self._github_releases: Dict[str, Optional[dict]] = {}
+        # One git process answers every tag existence check
+        self._ref_check = GitBatchCheck(self.repo_dir)
+
     def is_semantic_version(self, version: str) -> bool:
         """Check if a string is a valid semantic version number.
 
@@ -71,8 +111,7 @@ class DemoReleasePipeline:
         Returns:
             bool: True if the version is a valid semantic version, False otherwise
         """
-        pattern = r"^\d+\.\d+\.\d+$"
-        return bool(re.match(pattern, version))
+        return _SEMVER_RE.fullmatch(version) is not None
 
     def run_git_command(
         self,
@@ -95,27 +134,93 @@ class DemoReleasePipeline:
         repo_dir = repo_dir if repo_dir else self.repo_dir
         dry_run = self.dry_run if dry_run is None else dry_run
         if dry_run:
-            logger.info(f'[DRY RUN] Would run git command: {" ".join(command)}')
+            logger.info("[DRY RUN] Would run git command: %s", " ".join(command))
             return None
 
         # Set check=False by default unless overridden in kwargs
         if "check" not in kwargs:
             kwargs["check"] = False
+        # Our fds are non-inheritable (PEP 446), so there is nothing for the child to close;
+        # before Python 3.13 close_fds=True also rules out posix_spawn
+        kwargs.setdefault("close_fds", False)
+
+        # Run git by absolute path with -C rather than cwd= so subprocess can use posix_spawn
+        if command[0] == "git":
+            return subprocess.run([git_executable(), "-C", repo_dir, *command[1:]], **kwargs)
         return subprocess.run(command, cwd=repo_dir, **kwargs)
 
+    def _iter_git_lines(self, command: list, repo_dir: Optional[str] = None) -> Iterator[str]:
+        """Yield the output lines of a read-only git command as git produces them.
+
+        Unlike capture_output, the output is never held in memory as a whole, and closing
+        the iterator early terminates git.
+
+        Raises:
+            subprocess.CalledProcessError: If git fails after all of its output was read
+        """
+        repo_dir = repo_dir if repo_dir else self.repo_dir
+        argv = [git_executable(), "-C", repo_dir, *command[1:]]
+        with subprocess.Popen(
+            argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, close_fds=False
+        ) as proc:
+            finished = False
+            try:
+                for line in proc.stdout:
+                    yield line.rstrip("\n")
+                finished = True
+            finally:
+                if not finished:
+                    proc.terminate()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, argv)
+
+    def _sync_branch(self, branch: str) -> None:
+        """Check out a branch with the latest commits from origin.
+
+        The branch is fast-forwarded by the fetch itself and then switched to. Git refuses
+        to fetch into the checked-out branch or one that has diverged from origin, so in
+        those cases the branch is pulled after switching instead.
+
+        Raises:
+            subprocess.CalledProcessError: If the branch can't be switched to or pulled
+        """
+        result = self.run_git_command(
+            ["git", "fetch", "-q", "--no-write-fetch-head", "origin", f"{branch}:{branch}"],
+            stderr=subprocess.DEVNULL,
+        )
+        self.run_git_command(
+            ["git", "switch", "-q", branch],
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
+        if result is not None and result.returncode != 0:
+            self.run_git_command(["git", "pull", "-q", "origin", branch], check=True)
+
+    def get_release_tags(self) -> List[str]:
+        """Get the release tags, newest version first.
+
+        The tags are listed with a single git call, letting git filter and version-sort
+        them, and kept until the pipeline changes the repo.
+        """
+        if self._release_tags is None:
+            try:
+                self._release_tags = list(
+                    self._iter_git_lines(
+                        ["git", "tag", "--list", "release-v*", "--sort=-v:refname"]
+                    )
+                )
+            except subprocess.CalledProcessError:
+                return []
+        return self._release_tags
+
     def validate_git_tag(self, version: str) -> bool:
         """Check if a git tag exists for the given version."""
-        try:
-            # Check if the tag exists
-            result = self.run_git_command(
-                ["git", "tag", "-l", f"release-v{version}"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return bool(result.stdout.strip())
-        except subprocess.CalledProcessError:
-            return False
+        return self._ref_check.resolve(f"refs/tags/release-v{version}") is not None
+
+    def close(self) -> None:
+        """Stop the git process used for tag checks."""
+        self._ref_check.close()
 
     def get_valid_version_input(self) -> Optional[str]:
         """Get and validate version input from the user.
@@ -129,25 +234,19 @@ class DemoReleasePipeline:
             if not self.is_semantic_version(version):
                 logger.error(f"Invalid version format: {version}")
                 logger.info("Version must be in semantic version format (e.g., 1.2.3)")
-                retry = input("Would you like to try again? [yN] ")
-                if not retry.lower().startswith("y"):
+                if not _confirm("Would you like to try again? [yN] "):
                     return None
                 continue
 
             if not self.validate_git_tag(version):
                 logger.error(f"No git tag found for version: release-v{version}")
                 logger.info("Available release tags:")
-                # Show available tags for reference
-                subprocess.run(
-                    ["git", "tag", "-l", "|", "sort", "-V", "|", "grep", "release-v*"],
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=self.repo_dir,
-                )
-                retry = input("Would you like to try again? [yN] ")
-                if not retry.lower().startswith("y"):
+                # Show the newest available tags for reference
+                tags = self.get_release_tags()
+                logger.info("\n".join(tags[:_MAX_LISTED_TAGS]))
+                if len(tags) > _MAX_LISTED_TAGS:
+                    logger.info(f"... and {len(tags) - _MAX_LISTED_TAGS} older tags")
+                if not _confirm("Would you like to try again? [yN] "):
                     return None
                 continue
 
@@ -157,39 +256,54 @@ class DemoReleasePipeline:
         """Get the latest release tag from git."""
         print(f"Getting latest release tag from {self.repo_dir}...")
         try:
-            # Pull all branches and tags
-            self.run_git_command(["git", "pull", "-q", "--all"], dry_run=False, check=True)
-            result = self.run_git_command(
-                ["git", "rev-list", "--tags", "--max-count=1"],
+            # Only the tags are needed here; branches are synced by _sync_branch when the
+            # pipeline switches to them, and submodules are never tagged for release
+            self.run_git_command(
+                ["git", "fetch", "--tags", "--quiet", "--no-recurse-submodules", "origin"],
                 dry_run=False,
                 check=True,
-                text=True,
-                capture_output=True,
             )
-            tag = result.stdout.strip()
-            print(f"Latest tag: {tag}")
-            # Get latest tag
             result = self.run_git_command(
-                ["git", "describe", "--tags", tag],
+                [
+                    "git",
+                    "for-each-ref",
+                    "--count=1",
+                    "--sort=-creatordate",
+                    "--format=%(refname:strip=2)",
+                    "refs/tags",
+                ],
                 dry_run=False,
                 check=True,
                 text=True,
                 capture_output=True,
             )
-            return result.stdout.strip()
+            tag = result.stdout.strip()
+            if not tag:
+                logger.info(f"No release tags found in {self.repo_dir}.")
+                return None
+            print(f"Latest tag: {tag}")
+            return tag
         except subprocess.CalledProcessError:
             logger.info(f"No release tags found in {self.repo_dir}.")
             return None
             # raise ValueError(f"No release tags found in {self.repo_dir}") from err
 
+    def _get_github_release(self, tag: str) -> Optional[dict]:
+        """Look up the GitHub release for a tag, remembering the answer.
+
+        A lookup that fails raises and is not remembered, so the next call asks again.
+        """
+        if tag not in self._github_releases:
+            self._github_releases[tag] = self.release_helper.find_github_release_by_tag(tag)
+        return self._github_releases[tag]
+
     def delete_github_release(
         self, repo: str, owner: str, tag: str, non_interactive: bool = False
     ) -> None:
         """Delete a GitHub release."""
 
         try:
-            # Get all releases to find the one with matching tag
-            release = self.release_helper.get_github_release_by_tag(tag)
+            release = self._get_github_release(tag)
         except (ConnectionError, ValueError, RuntimeError, IOError) as e:
             logger.error(f"Error fetching releases: {str(e)}")
             return
@@ -200,8 +314,7 @@ class DemoReleasePipeline:
         release_id = release.get("id")
 
         if not non_interactive:
-            response = input(f"Do you want to delete github release: {tag}? [yN] ")
-            if not response.lower().startswith("y"):
+            if not _confirm(f"Do you want to delete github release: {tag}? [yN] "):
                 return
         try:
             if self.dry_run:
@@ -213,6 +326,7 @@ class DemoReleasePipeline:
 
             # Delete the release
             if self.release_helper.delete_github_release(release_id):
+                self._github_releases.pop(tag, None)
                 logger.info(f"Successfully deleted GitHub release {tag} for {owner}/{repo}")
             else:
                 logger.error(f"Failed to delete GitHub release {tag}")
@@ -225,43 +339,51 @@ class DemoReleasePipeline:
         logger.info(f"Reverting to version: {previous_version}")
 
         if self.dry_run:
-            logger.info("[DRY RUN] Would perform the following actions:")
-            logger.info("1. Checkout and pull version branch")
-            logger.info(f"2. Update version file to {previous_version}")
-            logger.info("3. Commit and push changes")
-            logger.info("4. Recreate release branch")
+            logger.info(
+                "\n".join(
+                    [
+                        "[DRY RUN] Would perform the following actions:",
+                        "1. Checkout and pull version branch",
+                        f"2. Update version file to {previous_version}",
+                        "3. Commit and push changes",
+                        "4. Recreate release branch",
+                    ]
+                )
+            )
             return
 
         try:
             # Change to version branch
-            self.run_git_command(
-                ["git", "checkout", "version"],
-                check=True,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.DEVNULL,
-            )
-            self.run_git_command(["git", "pull", "-q", "origin", "version"], check=True)
+            self._sync_branch("version")
 
             # Update version file
-            version_file = os.path.join(self.repo_dir, "version")
-            with open(version_file, "w", encoding="utf-8") as f:
-                f.write(previous_version)
+            self._version_file.write_text(previous_version, encoding="utf-8")
 
-            # Commit changes
-            self.run_git_command(["git", "add", "."], check=True)
+            # Commit changes, staging the version file as part of the commit
             self.run_git_command(
-                ["git", "commit", "-m", f"Revert version back to {previous_version} NOTICKET"],
+                [
+                    "git",
+                    "commit",
+                    "-m",
+                    f"Revert version back to {previous_version} NOTICKET",
+                    "--",
+                    "version",
+                ],
                 check=True,
             )
-            self.run_git_command(["git", "push", "origin", "version"], check=True)
+            self._release_tags = None
 
-            # Recreate release branch
+            # Recreate release branch: -B resets it in place. The local version branch is
+            # what origin will have once pushed, so merge it without pulling it back.
             self.run_git_command(["git", "checkout", "master"], check=True)
-            self.run_git_command(["git", "pull", "-q", "origin", "version"], check=True)
-            self.run_git_command(["git", "branch", "-D", "release"], check=True)
-            self.run_git_command(["git", "push", "--delete", "origin", "release"], check=True)
-            self.run_git_command(["git", "checkout", "-b", "release"], check=True)
-            self.run_git_command(["git", "push", "-u", "origin", "release"], check=True)
+            self.run_git_command(["git", "merge", "-q", "version"], check=True)
+            self.run_git_command(["git", "checkout", "-B", "release"], check=True)
+
+            # Push the version branch and force-replace the remote release branch in one
+            # round trip; --atomic leaves both untouched if either is rejected
+            self.run_git_command(
+                ["git", "push", "--atomic", "-u", "origin", "version", "+release"], check=True
+            )
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Git operation failed: {e.cmd}")
@@ -283,10 +405,10 @@ class DemoReleasePipeline:
             args: List of arguments to pass to fly.sh
         """
         if self.dry_run:
-            logger.info(f'[DRY RUN] Would run fly.sh with args: {" ".join(args)}')
+            logger.info("[DRY RUN] Would run fly.sh with args: %s", " ".join(args))
             return
 
-        ci_dir = os.path.join(self.repo_dir, "ci")
+        ci_dir = self._ci_dir
         if not os.path.isdir(ci_dir):
             logger.error(f"CI directory not found at {ci_dir}")
             return
@@ -338,20 +460,25 @@ class DemoReleasePipeline:
         """Run the release pipeline."""
 
         if self.dry_run:
-            logger.info("[DRY RUN] Would perform the following actions:")
-            logger.info(f"1. Ask to recreate release pipeline: {self.release_pipeline}")
-            logger.info("2. Run fly.sh with parameters:")
-            logger.info(f"   - foundation: {self.foundation}")
-            logger.info(f"   - release body: {self.release_body}")
-            logger.info(f"   - owner: {self.owner}")
-            logger.info(f"   - pipeline: {self.release_pipeline}")
-            logger.info(f"3. Ask to run pipeline: {self.release_pipeline}")
-            logger.info("4. Update git release tag")
+            logger.info(
+                "\n".join(
+                    [
+                        "[DRY RUN] Would perform the following actions:",
+                        f"1. Ask to recreate release pipeline: {self.release_pipeline}",
+                        "2. Run fly.sh with parameters:",
+                        f"   - foundation: {self.foundation}",
+                        f"   - release body: {self.release_body}",
+                        f"   - owner: {self.owner}",
+                        f"   - pipeline: {self.release_pipeline}",
+                        f"3. Ask to run pipeline: {self.release_pipeline}",
+                        "4. Update git release tag",
+                    ]
+                )
+            )
             return
 
         # Recreate release pipeline if needed
-        response = input("Do you want to recreate the release pipeline? [yN] ")
-        if response.lower().startswith("y"):
+        if _confirm("Do you want to recreate the release pipeline? [yN] "):
             # Using our ConcourseClient to destroy pipeline
             cmd = ["-t", "tkgi-pipeline-upgrade", "dp", "-p", self.release_pipeline, "-n"]
             self.concourse_client._run_fly_command(cmd)
@@ -371,37 +498,37 @@ class DemoReleasePipeline:
         )
 
         # Run pipeline if requested
-        response = input(f"Do you want to run the {self.release_pipeline} pipeline? [yN] ")
-        if response.lower().startswith("y"):
+        if _confirm(f"Do you want to run the {self.release_pipeline} pipeline? [yN] "):
             # Using our ConcourseClient to unpause, trigger and watch the pipeline
-            self.concourse_client.unpause_pipeline("tkgi-pipeline-upgrade", self.release_pipeline)
-            self.concourse_client.trigger_job(
-                "tkgi-pipeline-upgrade", f"{self.release_pipeline}/create-final-release"
-            )
-            self.concourse_client.watch_job(
-                "tkgi-pipeline-upgrade", f"{self.release_pipeline}/create-final-release"
+            self.concourse_client.run_and_watch(
+                "tkgi-pipeline-upgrade", self.release_pipeline, "create-final-release"
             )
 
     def run_set_pipeline(self) -> None:
         """Run the set release pipeline."""
 
         if self.dry_run:
-            logger.info("[DRY RUN] Would perform the following actions:")
-            logger.info(f"1. Ask to run pipeline: {self.set_release_pipeline}")
-            logger.info("2. Run fly.sh with parameters:")
-            logger.info(f"   - foundation: {self.foundation}")
-            logger.info(f"   - set pipeline: {self.set_release_pipeline}")
-            logger.info(f"   - branch: {self.branch}")
-            logger.info(f"   - params branch: {self.params_branch}")
-            logger.info(f"   - owner: {self.owner}")
-            logger.info(f"   - pipeline: {self.mgmt_pipeline}")
-            logger.info("3. Unpause and trigger set-release-pipeline job")
-            logger.info(f"4. Ask to run pipeline: {self.mgmt_pipeline}")
-            logger.info("5. Unpause and trigger prepare-kustomizations job")
+            logger.info(
+                "\n".join(
+                    [
+                        "[DRY RUN] Would perform the following actions:",
+                        f"1. Ask to run pipeline: {self.set_release_pipeline}",
+                        "2. Run fly.sh with parameters:",
+                        f"   - foundation: {self.foundation}",
+                        f"   - set pipeline: {self.set_release_pipeline}",
+                        f"   - branch: {self.branch}",
+                        f"   - params branch: {self.params_branch}",
+                        f"   - owner: {self.owner}",
+                        f"   - pipeline: {self.mgmt_pipeline}",
+                        "3. Unpause and trigger set-release-pipeline job",
+                        f"4. Ask to run pipeline: {self.mgmt_pipeline}",
+                        "5. Unpause and trigger prepare-kustomizations job",
+                    ]
+                )
+            )
             return
 
-        response = input(f"Do you want to run the {self.set_release_pipeline} pipeline? [yN] ")
-        if response.lower().startswith("y"):
+        if _confirm(f"Do you want to run the {self.set_release_pipeline} pipeline? [yN] "):
             self.run_fly_script(
                 [
                     "-f",
@@ -420,93 +547,111 @@ class DemoReleasePipeline:
             )
 
             # Using our ConcourseClient to unpause pipeline and trigger job
-            self.concourse_client.unpause_pipeline(self.foundation, self.set_release_pipeline)
-            self.concourse_client.trigger_job(
-                self.foundation, f"{self.set_release_pipeline}/set-release-pipeline", watch=True
+            self.concourse_client.run_and_watch(
+                self.foundation, self.set_release_pipeline, "set-release-pipeline"
             )
 
-            response = input(f"Do you want to run the {self.mgmt_pipeline} pipeline? [yN] ")
-            if response.lower().startswith("y"):
+            if _confirm(f"Do you want to run the {self.mgmt_pipeline} pipeline? [yN] "):
                 # Using our ConcourseClient to unpause pipeline and trigger job
-                self.concourse_client.unpause_pipeline(self.foundation, self.mgmt_pipeline)
-                self.concourse_client.trigger_job(
-                    self.foundation, f"{self.mgmt_pipeline}/prepare-kustomizations", watch=True
+                self.concourse_client.run_and_watch(
+                    self.foundation, self.mgmt_pipeline, "prepare-kustomizations"
                 )
 
     def refly_pipeline(self) -> None:
         """Refly the pipeline back to latest code."""
 
         if self.dry_run:
-            logger.info("[DRY RUN] Would perform the following actions:")
             logger.info(
-                f"1. Ask to refly the {self.mgmt_pipeline} pipeline "
-                f"back to latest code on branch: {self.branch}"
+                "\n".join(
+                    [
+                        "[DRY RUN] Would perform the following actions:",
+                        f"1. Ask to refly the {self.mgmt_pipeline} pipeline "
+                        f"back to latest code on branch: {self.branch}",
+                    ]
+                )
             )
             return
 
-        response = input(
+        if _confirm(
             f"Do you want to refly the {self.mgmt_pipeline} pipeline "
             f"back to latest code on branch: {self.branch}? [yN] "
-        )
-        if response.lower().startswith("y"):
+        ):
             self.run_fly_script(
                 ["-f", self.foundation, "-b", self.branch, "-p", self.mgmt_pipeline]
             )
 
-            response = input(f"Do you want to rerun the {self.mgmt_pipeline} pipeline? [yN] ")
-            if response.lower().startswith("y"):
+            if _confirm(f"Do you want to rerun the {self.mgmt_pipeline} pipeline? [yN] "):
                 # Using our ConcourseClient to unpause pipeline and trigger job
-                self.concourse_client.unpause_pipeline(self.foundation, self.mgmt_pipeline)
-                self.concourse_client.trigger_job(
-                    self.foundation, f"{self.mgmt_pipeline}/prepare-kustomizations", watch=True
+                self.concourse_client.run_and_watch(
+                    self.foundation, self.mgmt_pipeline, "prepare-kustomizations"
                 )
 
-    def handle_version_reversion(self) -> None:
-        """Handle checking current version and potential reversion to an older version."""
-        if self.dry_run:
-            logger.info("[DRY RUN] Would perform the following actions:")
-            logger.info("1. Checkout and pull version branch")
-            logger.info("2. Read current version from version file")
-            logger.info("3. Ask if you want to revert to an older version")
-            logger.info("4. If yes, validate and prompt for previous version")
-            logger.info("5. If valid, revert to the specified version")
-            return
+    def _fetch_version_branch(self) -> bool:
+        """Fetch the latest version branch into origin/version, logging any git failure.
 
+        Returns:
+            bool: True if origin/version is up to date
+        """
         try:
-            # Check current version
-            self.run_git_command(["git", "checkout", "version"], check=True)
-            self.run_git_command(["git", "pull", "-q", "origin", "version"], check=True)
+            self.run_git_command(["git", "fetch", "-q", "origin", "version"], check=True)
+            return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Git operation failed: {e.cmd}")
             logger.error(f"Exit code: {e.returncode}")
             if e.output:
                 logger.error(f"Output: {e.output.decode()}")
+            return False
+
+    def handle_version_reversion(self, version_fetched: Optional[bool] = None) -> None:
+        """Handle checking current version and potential reversion to an older version.
+
+        The current version is read from origin/version without checking the branch out;
+        only a reversion switches branches.
+
+        Args:
+            version_fetched: Result of _fetch_version_branch when the caller has already
+                run it, otherwise the version branch is fetched here
+        """
+        if self.dry_run:
+            logger.info(
+                "\n".join(
+                    [
+                        "[DRY RUN] Would perform the following actions:",
+                        "1. Fetch version branch",
+                        "2. Read current version from the version file on origin/version",
+                        "3. Ask if you want to revert to an older version",
+                        "4. If yes, validate and prompt for previous version",
+                        "5. If valid, revert to the specified version",
+                    ]
+                )
+            )
             return
 
-        version_file = os.path.join(self.repo_dir, "version")
-        if not os.path.exists(version_file):
-            logger.error(f"Version file not found at {version_file}")
-            self.run_git_command(["git", "checkout", self.branch], check=True)
+        # Check current version
+        if version_fetched is None:
+            version_fetched = self._fetch_version_branch()
+        if not version_fetched:
             return
 
         try:
-            with open(version_file, "r", encoding="utf-8") as f:
-                current_version = f.read().strip()
-        except Exception as e:
-            logger.error(f"Error reading version file: {str(e)}")
-            self.run_git_command(
-                ["git", "checkout", self.branch],
+            result = self.run_git_command(
+                ["git", "cat-file", "blob", "origin/version:version"],
                 check=True,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.DEVNULL,
+                capture_output=True,
+                encoding="utf-8",
             )
+            current_version = result.stdout.strip()
+        except subprocess.CalledProcessError:
+            logger.error("Version file not found on origin/version")
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Error reading version file: {str(e)}")
             return
 
         logger.info(f"The current version is: {current_version}")
 
         # Handle version reversion if requested
-        response = input("Do you want to revert to an older version? [yN] ")
-        if response.lower().startswith("y"):
+        if _confirm("Do you want to revert to an older version? [yN] "):
             previous_version = self.get_valid_version_input()
             if previous_version:
                 self.revert_version(previous_version)
@@ -516,58 +661,51 @@ class DemoReleasePipeline:
         # Checkout the original branch
         if self.branch == "version":
             self.branch = "develop"
-        self.run_git_command(
-            ["git", "checkout", self.branch],
-            check=True,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-        )
-        self.run_git_command(["git", "pull", "-q"], dry_run=False, check=True)
+        self._sync_branch(self.branch)
 
     def run(self) -> None:
         """Run the complete demo release pipeline."""
-        # Check for uncommitted changes
-        result = self.run_git_command(
-            ["git", "status", "--porcelain"],
-            dry_run=False,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        if result.stdout.strip():
-            logger.error("Please commit or stash your changes before running this script")
-            return
+        # Check for uncommitted changes and find the current branch in one call. The branch
+        # headers come first, so stop reading (and stop git) at the first changed file.
+        current_branch = None
+        status_lines = self._iter_git_lines(["git", "status", "--porcelain=v2", "--branch"])
+        for line in status_lines:
+            if line.startswith("# branch.head "):
+                current_branch = line[len("# branch.head ") :]
+            elif not line.startswith("#"):
+                status_lines.close()
+                logger.error("Please commit or stash your changes before running this script")
+                return
 
         # Get current branch if not specified
         if not self.branch:
-            try:
-                # Check if the tag exists
-                result = self.run_git_command(
-                    ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                    dry_run=False,
-                    check=True,
-                    text=True,
-                    capture_output=True,
-                )
-                if result is None:
-                    logger.error("Failed to get current branch")
-                    return
-                # Get the current branch name
-                self.branch = result.stdout.strip()
-                print(f"Current branch: {self.branch}")
-            except subprocess.CalledProcessError:
-                return False
+            if current_branch is None:
+                logger.error("Failed to get current branch")
+                return
+            # A detached HEAD is reported as "(detached)"; rev-parse --abbrev-ref called it HEAD
+            self.branch = "HEAD" if current_branch == "(detached)" else current_branch
+            print(f"Current branch: {self.branch}")
 
         # Get latest release tag if not specified
         if not self.release_tag:
             self.release_tag = self.get_latest_release_tag()
 
+        version_fetched = None
         if self.release_tag is not None:
+            if not self.dry_run:
+                # The GitHub lookup only waits on the network, so run it in the background
+                # while the version branch is fetched. Prompts stay on this thread, in order.
+                # A failed lookup is not remembered, so delete_github_release tries it again
+                # and reports the error.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(self._get_github_release, self.release_tag)
+                    version_fetched = self._fetch_version_branch()
+
             # Delete GitHub release if requested and a release is found
             self.delete_github_release(self.repo, self.owner, self.release_tag)
 
         # Handle version checking and potential reversion
-        self.handle_version_reversion()
+        self.handle_version_reversion(version_fetched)
 
         # Run the pipeline steps
         self.run_release_pipeline()
@@ -576,10 +714,9 @@ class DemoReleasePipeline:
 
         if not self.release_helper.update_params_git_release_tag():
             logger.error("Failed to update git release tag")
-            response = input(
+            if not _confirm(
                 "Failed to update params git release tag. Do you want to continue anyway? [yN] "
-            )
-            if not response.lower().startswith("y"):
+            ):
                 logger.info("Exiting the pipeline process.")
                 sys.exit(1)
 
@@ -587,9 +724,12 @@ class DemoReleasePipeline:
         self.refly_pipeline()
 
 
-@wrap_main
-def main():
-    """Main function to parse arguments and run the demo release pipeline."""
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv[1:] when None.
+    """
     parser = HelpfulArgumentParser(
         prog="demo_release_pipeline.py",
         description="Demo release pipeline script",
@@ -680,7 +820,22 @@ Options:
         help="display usage",
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+@wrap_main
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main function to parse arguments and run the demo release pipeline.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv[1:] when None.
+    """
+    args = parse_args(argv)
+    _lazy_imports.load()
+    # Interactive run: when stdout is a pipe or file (e.g. a CI log), write each progress
+    # line as it is printed instead of when the block buffer fills
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
     repo = args.repo
     params_repo = args.params_repo
     owner = args.owner
@@ -692,27 +847,21 @@ Options:
     params_branch = args.params_branch
     release_tag = args.tag
 
-    if not os.path.isdir(git_dir):
+    git_root = Path(git_dir).expanduser()
+    if not git_root.is_dir():
         raise ValueError(f"Could not find git directory: {git_dir}")
-    if not os.path.isdir(os.path.join(git_dir, repo)):
+    if not (git_root / repo).is_dir():
         raise ValueError(f"Could not find repo directory: {git_dir}/{repo}")
+    git_dir = str(git_root)
 
     logger.info(f"Creating release for repo: {repo}")
     logger.info(f"Foundation: {foundation}")
 
-    repo_dir = os.path.join(git_dir, repo)
-    params_dir = os.path.join(git_dir, params_repo)
+    # adjust_paths works out the repo and params directories, including any owner suffix
     path_helper = RepositoryPathHelper(git_dir=git_dir, owner=owner)
     repo, repo_dir, params_repo, params_dir = path_helper.adjust_paths(repo, params_repo)
 
-    release_pipeline = f"tkgi-{repo}-release"
-    set_pipeline = f"tkgi-{repo}-{foundation}-set-release-pipeline"
-    mgmt_pipeline = f"tkgi-{repo}-{foundation}"
-    if owner != "Utilities-tkgieng":
-        release_pipeline = f"tkgi-{repo}-{owner}-release"
-        set_pipeline = f"tkgi-{repo}-{owner}-{foundation}-set-release-pipeline"
-        mgmt_pipeline = f"tkgi-{repo}-{owner}-{foundation}"
-    release_pipeline = f"tkgi-{repo}-release"
+    release_pipeline, set_pipeline, mgmt_pipeline = path_helper.pipeline_names(repo, foundation)
     logger.info(f"Using release pipeline: {release_pipeline}")
     logger.info(f"Using set pipeline: {set_pipeline}")
     logger.info(f"Using mgmt pipeline: {mgmt_pipeline}")
@@ -762,7 +911,8 @@ Options:
         dry_run=dry_run,
     )
 
-    pipeline.run()
+    with closing(pipeline):
+        pipeline.run()
 
 
 if __name__ == "__main__":
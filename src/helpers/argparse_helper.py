@@ -10,11 +10,12 @@ class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
 
     def format_help(self):
         help_text = super().format_help()
-        # Remove the default options section
-        help_text = help_text.split("\n\n")[0] + "\n\n" + help_text.split("\n\n")[-1]
+        # Keep only the first section (usage) and the last one (the epilog), dropping the
+        # default options section in between
+        head, _, _ = help_text.partition("\n\n")
+        _, _, tail = help_text.rpartition("\n\n")
         # Change "usage:" to "Usage:"
-        help_text = help_text.replace("usage:", "Usage:")
-        return help_text
+        return f"{head}\n\n{tail}".replace("usage:", "Usage:", 1)
 
 
 class HelpfulArgumentParser(argparse.ArgumentParser):
@@ -36,7 +37,8 @@ class HelpfulArgumentParser(argparse.ArgumentParser):
 
     def error(self, message):
         """Override error method to avoid printing usage twice."""
-        self.print_usage = lambda file: None  # Disable automatic usage printing
+        # The help printed below includes the usage, so it is not printed separately. The
+        # parser itself is left unchanged, as it may be reused for later parses.
         sys.stderr.write(f"Error: {message}\n\n")
         self.print_help()
         self.exit(2)
@@ -3,8 +3,12 @@
 """Concourse CI client module for interacting with Concourse via fly CLI."""
 
 import os
+import shutil
 import subprocess
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+# Absolute fly path found for each PATH value, shared by every client in the process
+_FLY_PATH_CACHE: Dict[str, str] = {}
 
 
 class ConcourseClient:
@@ -14,6 +18,8 @@ class ConcourseClient:
     including managing pipelines, triggering jobs, and watching job output.
     """
 
+    __slots__ = ("fly_path", "_fly_scripts")
+
     def __init__(self, fly_path: Optional[str] = None) -> None:
         """Initialize the Concourse client.
 
@@ -21,17 +27,23 @@ class ConcourseClient:
             fly_path: Optional path to the fly executable. If not provided, assumes it's in PATH.
         """
         self.fly_path = fly_path or "fly"
+        # find_fly_script results keyed by directory and FLY_SCRIPT
+        self._fly_scripts: Dict[Tuple[str, str], Union[str, List[str]]] = {}
         self._validate_fly_cli()
 
     def _validate_fly_cli(self) -> None:
         """Validate that the fly CLI is available and executable."""
         if self.fly_path == "fly":
-            # Check if fly is in PATH
-            for path in os.environ["PATH"].split(os.pathsep):
-                executable = os.path.join(path, "fly")
-                if os.path.isfile(executable) and os.access(executable, os.X_OK):
-                    return
-            raise ValueError("fly CLI not found in PATH")
+            # Check if fly is in PATH, keeping the absolute path so subprocess can use
+            # posix_spawn rather than fork/exec to launch it
+            search_path = os.environ.get("PATH", "")
+            executable = _FLY_PATH_CACHE.get(search_path)
+            if executable is None:
+                executable = shutil.which("fly", path=search_path)
+                if executable is None:
+                    raise ValueError("fly CLI not found in PATH")
+                _FLY_PATH_CACHE[search_path] = executable
+            self.fly_path = executable
         else:
             # Check if specified fly path exists and is executable
             if not os.path.isfile(self.fly_path) or not os.access(self.fly_path, os.X_OK):
@@ -54,6 +66,7 @@ class ConcourseClient:
             subprocess.CalledProcessError: If the command fails
         """
         cmd = [self.fly_path] + args
+        kwargs.setdefault("close_fds", False)
         return subprocess.run(cmd, cwd=cwd, check=True, **kwargs)
 
     def unpause_pipeline(self, target: str, pipeline: str) -> None:
@@ -87,6 +100,19 @@ class ConcourseClient:
         """
         self._run_fly_command(["-t", target, "watch", "-j", job])
 
+    def run_and_watch(self, target: str, pipeline: str, job: str) -> None:
+        """Unpause a pipeline, then trigger one of its jobs and watch it until it finishes.
+
+        trigger-job -w streams the build itself, so no separate watch command is needed.
+
+        Args:
+            target: Concourse target
+            pipeline: Pipeline name
+            job: Job name within the pipeline
+        """
+        self.unpause_pipeline(target, pipeline)
+        self.trigger_job(target, f"{pipeline}/{job}", watch=True)
+
     def run_fly_script(self, script_path: str, args: List[str], cwd: Optional[str] = None) -> None:
         """Run a fly script with the given arguments.
 
@@ -105,29 +131,42 @@ class ConcourseClient:
         cmd = [script_path] + args
         subprocess.run(cmd, cwd=cwd, check=True)
 
-    def find_fly_script(self, directory: str) -> Optional[str]:
+    def find_fly_script(self, directory: str) -> Optional[Union[str, List[str]]]:
         """Find fly scripts in a directory.
 
         Args:
             directory: Directory to search in
 
         Returns:
-            Path to the found fly script or None if not found
+            Path to the found fly script, a list of paths if several were found,
+            or None if not found
         """
         # Check for FLY_SCRIPT environment variable first
         fly_script = os.getenv("FLY_SCRIPT")
+        key = (directory, fly_script or "")
+        if key in self._fly_scripts:
+            return self._fly_scripts[key]
+        found = self._search_fly_script(directory, fly_script)
+        # Misses aren't remembered, so a script added later is still found
+        if found is not None:
+            self._fly_scripts[key] = found
+        return found
+
+    def _search_fly_script(
+        self, directory: str, fly_script: Optional[str]
+    ) -> Optional[Union[str, List[str]]]:
+        """Search a directory for fly scripts, uncached; see find_fly_script."""
         if fly_script:
             if not os.path.isabs(fly_script):
                 fly_script = os.path.join(directory, fly_script)
             return fly_script if os.path.isfile(fly_script) else None
 
         # Look for any script that starts with 'fly'
-        fly_scripts = []
-        for item in os.listdir(directory):
-            if item.startswith("fly"):
-                script_path = os.path.join(directory, item)
-                if os.path.isfile(script_path):
-                    fly_scripts.append(script_path)
+        # scandir's entries carry the file type, so is_file() rarely needs a stat
+        with os.scandir(directory) as entries:
+            fly_scripts = [
+                entry.path for entry in entries if entry.name.startswith("fly") and entry.is_file()
+            ]
 
         if not fly_scripts:
             return None
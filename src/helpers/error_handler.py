@@ -1,5 +1,6 @@
 """Error handling utilities for pipeline helpers."""
 
+import functools
 import logging
 import os
 import sys
@@ -9,6 +10,60 @@ from typing import Callable, Optional
 
 from src.helpers.logger import default_logger as logger
 
+# ANSI color codes for the terminal error message: red "Error:", yellow message, cyan log path
+RED = "\033[31m"
+YELLOW = "\033[33m"
+CYAN = "\033[36m"
+RESET = "\033[0m"
+
+# Format for records written to the log file
+_FILE_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+# PIPELINE_HELPERS_LOG_TO_FILE values that leave file logging off
+_FILE_LOGGING_OFF = frozenset(("", "0", "false", "no", "off"))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_log_file(day: str) -> str:
+    """Return the default log file for a day (YYYYMMDD), creating its directory once."""
+    log_dir = os.path.expanduser("~/.pipeline-helpers/logs")
+    os.makedirs(log_dir, exist_ok=True)
+    return os.path.join(log_dir, f"pipeline-helpers-{day}.log")
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that only flushes on errors.
+
+    logging.FileHandler flushes after every record, which costs a write() per log line.
+    This handler leaves records in the file buffer until it fills, a record at flush_level
+    or above is logged, or logging shuts down at exit and closes the handler.
+    """
+
+    def __init__(
+        self, filename: str, flush_level: int = logging.ERROR, buffer_size: int = 64 * 1024
+    ):
+        self.flush_level = flush_level
+        self.buffer_size = buffer_size
+        # Open the file on the first record rather than when the handler is attached
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 def setup_error_logging(log_file: Optional[str] = None, console_level: int = logging.INFO) -> str:
     """Set up logging to write to both console and file.
@@ -23,7 +78,7 @@ def setup_error_logging(log_file: Optional[str] = None, console_level: int = log
     # Check if file logging is enabled via environment variable
     # If PIPELINE_HELPERS_LOG_TO_FILE is not set or set to 0/false/no, file logging is disabled
     env_log_to_file = os.environ.get("PIPELINE_HELPERS_LOG_TO_FILE", "").lower()
-    file_logging_enabled = env_log_to_file not in ("", "0", "false", "no", "off")
+    file_logging_enabled = env_log_to_file not in _FILE_LOGGING_OFF
 
     # If file logging is disabled, return None
     if not file_logging_enabled and log_file is None:
@@ -31,10 +86,7 @@ def setup_error_logging(log_file: Optional[str] = None, console_level: int = log
 
     # Determine the log file location if not provided
     if log_file is None:
-        log_dir = os.path.expanduser("~/.pipeline-helpers/logs")
-        os.makedirs(log_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d")
-        log_file = os.path.join(log_dir, f"pipeline-helpers-{timestamp}.log")
+        log_file = _default_log_file(datetime.now().strftime("%Y%m%d"))
 
     # Configure the logger module to use the file
     # but don't add handlers to the root logger to avoid duplicate console output
@@ -45,9 +97,8 @@ def setup_error_logging(log_file: Optional[str] = None, console_level: int = log
 
     if not has_file_handler and log_file:
         # Create file handler for detailed logs
-        file_handler = logging.FileHandler(log_file)
-        file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        file_handler.setFormatter(file_formatter)
+        file_handler = BufferedFileHandler(log_file)
+        file_handler.setFormatter(_FILE_FORMATTER)
         file_handler.setLevel(logging.DEBUG)
         pipeline_logger.addHandler(file_handler)
         logger.info(f"Logging to file: {log_file}")
@@ -63,25 +114,24 @@ def handle_error(error: Exception, exit_code: int = 1, log_file: Optional[str] =
         exit_code: Exit code to use when terminating (default: 1)
         log_file: Optional path to log file. If None, uses default logging location
     """
-    # Get the full stack trace
-    stack_trace = traceback.format_exc()
-
     # Set up logging to file only for error handling
     log_file = setup_error_logging(log_file, console_level=logging.ERROR)
 
-    # Log the error and stack trace to file
+    # Log the error, and the stack trace only when there is a log file to keep it in
     logger.error(f"Error occurred: {str(error)}")
-    logger.error(f"Stack trace:\n{stack_trace}")
-
-    # Using ANSI color codes: Red for "Error:", Yellow for the message, Cyan for log file path
-    RED = "\033[31m"
-    YELLOW = "\033[33m"
-    CYAN = "\033[36m"
-    RESET = "\033[0m"
-
-    # Print error message to terminal directly (not through logger)
-    print(f"\n{RED}Error:{RESET} {YELLOW}{str(error)}{RESET}\n")
-    print(f"See {CYAN}{log_file}{RESET} for detailed information.\n")
+    if log_file:
+        logger.error("Stack trace:\n%s", traceback.format_exc())
+
+    # Print error message to terminal directly (not through logger), in a single write and
+    # without color codes when the output is not a terminal
+    if sys.stdout.isatty():
+        red, yellow, cyan, reset = RED, YELLOW, CYAN, RESET
+    else:
+        red = yellow = cyan = reset = ""
+    message = f"\n{red}Error:{reset} {yellow}{error}{reset}\n\n"
+    if log_file:
+        message += f"See {cyan}{log_file}{reset} for detailed information.\n\n"
+    sys.stdout.write(message)
 
     # Exit with the specified exit code
     sys.exit(exit_code)
@@ -102,6 +152,7 @@ def wrap_main(main_func: Callable) -> Callable:
         A wrapped function with error handling
     """
 
+    @functools.wraps(main_func)
     def wrapped_main(*args, **kwargs):
         # Set up logging to file for the entire script execution based on environment variable
         log_file = setup_error_logging()
@@ -111,13 +162,11 @@ def wrap_main(main_func: Callable) -> Callable:
         except ValueError as e:
             handle_error(e, log_file=log_file)
         except Exception as e:
-            # For other exceptions, still log them but re-raise
+            # For other exceptions, still log them but re-raise. The re-raised exception
+            # prints its own traceback, so only format one for the log file.
             logger.error(f"Unexpected error: {str(e)}")
-            logger.error(f"Stack trace:\n{traceback.format_exc()}")
+            if log_file:
+                logger.error("Stack trace:\n%s", traceback.format_exc())
             raise
 
-    # Preserve the original function's name and docstring
-    wrapped_main.__name__ = main_func.__name__
-    wrapped_main.__doc__ = main_func.__doc__
-
     return wrapped_main
@@ -1,14 +1,151 @@
 #!/usr/bin/env python3
 
+import functools
 import os
 import re
+import shutil
+import subprocess
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import git
 
 from src.helpers.logger import default_logger as logger
 
+# Owner and repo name from an SSH or HTTPS GitHub remote URL
+_GITHUB_URL_RE = re.compile(r"github\.com[:/]([^/]+)/([^/.]+)")
+
+
+@functools.lru_cache(maxsize=128)
+def _is_git_repo(repo_dir: str, mtime_ns: int) -> bool:
+    """Check if repo_dir is a git repository.
+
+    The mtime of the repository's .git entry is part of the cache key so that a
+    repository that is re-initialised or removed is checked again.
+    """
+    try:
+        git.Repo(repo_dir)
+        return True
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def git_executable() -> str:
+    """Resolve the git executable to an absolute path once per process.
+
+    subprocess can only launch with posix_spawn instead of fork/exec when the executable
+    is an absolute path and no cwd is given (see subprocess._USE_POSIX_SPAWN).
+    """
+    return shutil.which("git") or "git"
+
+
+class GitBatchCheck:
+    """A long-lived `git cat-file --batch-check` process for resolving many object names.
+
+    Each lookup writes one line to git and reads one line back, so checking any number of
+    refs costs a single git process instead of one per ref. The process is started on the
+    first lookup and stopped by close().
+    """
+
+    def __init__(self, repo_dir: str):
+        self.repo_dir = repo_dir
+        self._proc: Optional[subprocess.Popen] = None
+
+    def resolve(self, name: str) -> Optional[Tuple[str, str]]:
+        """Resolve an object name such as refs/tags/v1.0.0.
+
+        Returns:
+            Tuple[str, str]: The object SHA and type, or None if the name doesn't resolve
+        """
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                [
+                    git_executable(),
+                    "-C",
+                    self.repo_dir,
+                    "cat-file",
+                    "--batch-check=%(objectname) %(objecttype)",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        self._proc.stdin.write(f"{name}\n")
+        self._proc.stdin.flush()
+        sha, _, object_type = self._proc.stdout.readline().strip().partition(" ")
+        # Unknown names come back as "<name> missing" (or "ambiguous")
+        if not object_type or object_type in ("missing", "ambiguous"):
+            return None
+        return sha, object_type
+
+    def close(self) -> None:
+        """Stop the git process."""
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc.stdout.close()
+            self._proc = None
+
+    def __enter__(self) -> "GitBatchCheck":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _iter_files(directory: str, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """Yield paths of files under a directory whose names end with one of the suffixes.
+
+    Walks like os.walk: unreadable directories are skipped and symlinked directories are
+    not followed.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    yield from _iter_files(entry.path, suffixes)
+            elif entry.name.endswith(suffixes):
+                yield entry.path
+
+
+def _replace_file(file_path: str, data: bytes) -> None:
+    """Replace a file's contents by renaming a temporary file over it.
+
+    An interrupted write never leaves a truncated file behind. Symlinks are followed, so
+    the file a link points to is replaced rather than the link itself.
+    """
+    real_path = os.path.realpath(file_path)
+    tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(real_path), delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        shutil.copymode(real_path, tmp.name)
+        os.replace(tmp.name, real_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def _ref_exists(repo_obj: git.Repo, ref_path: str) -> bool:
+    """Check if a ref exists by reading loose and packed refs, without spawning git."""
+    try:
+        git.SymbolicReference.dereference_recursive(repo_obj, ref_path)
+        return True
+    except ValueError:
+        return False
+
 
 class GitHelper:
     """Helper class for git operations used in release pipeline scripts."""
@@ -28,6 +165,10 @@ class GitHelper:
         self.repo_dir = repo_dir if repo_dir else os.path.join(self.git_dir, self.repo)
         self.params = params
         self.params_dir = params_dir if params_dir else os.path.join(self.git_dir, self.params)
+        self._tags: Dict[str, Dict[str, str]] = {}
+        # git.Repo objects by directory. GitPython reads HEAD, refs and config from disk
+        # on access, so a Repo stays current and only its setup is saved.
+        self._repos: Dict[str, git.Repo] = {}
 
     # Logging methods removed - use logger directly
 
@@ -40,7 +181,7 @@ class GitHelper:
                 if remote.name == "origin":
                     url = next(remote.urls)
                     # Handle SSH or HTTPS URL formats
-                    match = re.search(r"github\.com[:/]([^/]+)/([^/.]+)", url)
+                    match = _GITHUB_URL_RE.search(url)
                     if match:
                         return match.group(1), match.group(2)
 
@@ -50,24 +191,53 @@ class GitHelper:
 
     def check_git_repo(self, repo: Optional[str] = None) -> bool:
         """Check if repo is a git repository."""
-        repo_dir = self.repo_dir if repo is None else os.path.join(self.git_dir, repo)
+        repo_dir = os.path.abspath(
+            self.repo_dir if repo is None else os.path.join(self.git_dir, repo)
+        )
         try:
-            git.Repo(repo_dir)
-            return True
-        except (git.InvalidGitRepositoryError, git.NoSuchPathError):
-            return False
+            mtime_ns = os.stat(os.path.join(repo_dir, ".git")).st_mtime_ns
+        except OSError:
+            # Bare repositories have no .git entry, fall back to the directory itself
+            try:
+                mtime_ns = os.stat(repo_dir).st_mtime_ns
+            except OSError:
+                return False
+        return _is_git_repo(repo_dir, mtime_ns)
+
+    def _resolve_repo_dir(self, repo: Optional[str] = None) -> str:
+        """Get the directory of the specified repository, defaulting to this helper's repo.
+
+        The params repo resolves to params_dir, which holds another owner's clone when the
+        name alone would point at the default owner's.
+        """
+        if repo is None:
+            return self.repo_dir
+        if repo == self.params:
+            return self.params_dir
+        return os.path.join(self.git_dir, repo)
 
     def _get_repo(self, repo: Optional[str] = None) -> git.Repo:
-        """Get a git.Repo object for the specified repository."""
-        repo_dir = self.repo_dir if repo is None else os.path.join(self.git_dir, repo)
-        try:
-            return git.Repo(repo_dir)
-        except (git.InvalidGitRepositoryError, git.NoSuchPathError) as e:
-            logger.error(f"Failed to get repository '{repo_dir}': {e}")
-            raise
+        """Get a git.Repo object for the specified repository, reusing one already opened."""
+        repo_dir = self._resolve_repo_dir(repo)
+        repo_obj = self._repos.get(repo_dir)
+        if repo_obj is None:
+            try:
+                repo_obj = git.Repo(repo_dir)
+            except (git.InvalidGitRepositoryError, git.NoSuchPathError) as e:
+                logger.error(f"Failed to get repository '{repo_dir}': {e}")
+                raise
+            self._repos[repo_dir] = repo_obj
+        return repo_obj
+
+    def close(self) -> None:
+        """Close the opened repositories and the git processes they keep running."""
+        for repo_obj in self._repos.values():
+            repo_obj.close()
+        self._repos.clear()
 
     def pull(self, repo: Optional[str] = None) -> None:
         """Pull changes from remote."""
+        self._tags.pop(self._resolve_repo_dir(repo), None)
         try:
             repo_obj = self._get_repo(repo)
             origin = repo_obj.remotes.origin
@@ -77,6 +247,7 @@ class GitHelper:
 
     def pull_all(self, repo: Optional[str] = None) -> None:
         """Pull all changes from all remotes."""
+        self._tags.pop(self._resolve_repo_dir(repo), None)
         try:
             repo_obj = self._get_repo(repo)
             for remote in repo_obj.remotes:
@@ -105,16 +276,78 @@ class GitHelper:
         except (git.InvalidGitRepositoryError, git.NoSuchPathError, Exception):
             return []
 
+    def list_tags(self, repo: Optional[str] = None) -> Dict[str, str]:
+        """List tag names and the objects they point to.
+
+        The tags are read with a single `git for-each-ref` and cached until they are
+        changed through this helper or the repository is pulled.
+
+        Returns:
+            Dict[str, str]: Mapping of tag name to object SHA, empty if the tags can't be read
+        """
+        repo_dir = self._resolve_repo_dir(repo)
+        if repo_dir not in self._tags:
+            try:
+                output = self._get_repo(repo).git.for_each_ref(
+                    "--format=%(refname:strip=2) %(objectname)", "refs/tags"
+                )
+            except Exception as e:
+                logger.error(f"Failed to list tags: {e}")
+                return {}
+            tags = (line.partition(" ") for line in output.splitlines())
+            self._tags[repo_dir] = {name: sha for name, _, sha in tags}
+        return self._tags[repo_dir]
+
     def delete_tag(self, tag: str, repo: Optional[str] = None) -> bool:
         """Delete a git tag locally and remotely."""
+        return self.delete_tags([tag], repo)
+
+    def delete_tags(self, tags: List[str], repo: Optional[str] = None) -> bool:
+        """Delete git tags locally and remotely.
+
+        The remote tags are deleted with a single push, so removing several tags costs one
+        connection to the remote rather than one per tag.
+
+        Args:
+            tags: The names of the tags to delete
+            repo: The repository to delete the tags from
+
+        Returns:
+            True if the tags were deleted, False if any tag was not found locally or could not
+            be deleted
+        """
+        if not tags:
+            return True
+        self._tags.pop(self._resolve_repo_dir(repo), None)
         try:
             repo_obj = self._get_repo(repo)
-            # Delete locally
-            repo_obj.delete_tag(tag)
-            # Delete remotely
-            origin = repo_obj.remotes.origin
-            origin.push(refspec=f":refs/tags/{tag}")
-            return True
+            missing = []
+            refspecs = []
+            for tag in tags:
+                ref_path = f"refs/tags/{tag}"
+                if not _ref_exists(repo_obj, ref_path):
+                    missing.append(tag)
+                    continue
+                # Delete locally by removing the ref directly rather than running
+                # `git tag -d`. A tag can be both loose and packed, and each delete
+                # removes one of them.
+                git.SymbolicReference.delete(repo_obj, ref_path)
+                if _ref_exists(repo_obj, ref_path):
+                    git.SymbolicReference.delete(repo_obj, ref_path)
+                refspecs.append(f":{ref_path}")
+            if missing:
+                logger.error(f"Tag not found: {', '.join(missing)}")
+            if refspecs:
+                # Delete remotely
+                origin = repo_obj.remotes.origin
+                push_infos = origin.push(refspec=refspecs)
+                failed = [
+                    info.remote_ref_string for info in push_infos if info.flags & git.PushInfo.ERROR
+                ]
+                if failed:
+                    logger.error(f"Failed to delete tags on origin: {', '.join(failed)}")
+                    return False
+            return not missing
         except Exception as e:
             logger.error(f"Failed to delete tag: {e}")
             return False
@@ -123,7 +356,12 @@ class GitHelper:
         """Check if there are any uncommitted changes."""
         try:
             repo_obj = self._get_repo(repo)
-            return repo_obj.is_dirty()
+            # One status call covers both the index and the working tree, which is_dirty()
+            # checks with a separate diff each. Untracked files are ignored as before.
+            status = repo_obj.git.status(
+                "--porcelain", "-uno", "--no-renames", "--ignore-submodules=dirty", "-z"
+            )
+            return bool(status)
         except Exception as e:
             logger.error(f"Failed to check git status: {e}")
             return True
@@ -141,21 +379,19 @@ class GitHelper:
     ) -> None:
         """Update the release tag in params files."""
         params_dir = self.params_dir if params_repo is None else os.path.join(self.git_dir, repo)
+        suffixes = (f"-{repo}.yml", f".{repo}.yaml")
+        # Most params files don't mention the tag, so look for it in the raw bytes and
+        # only rewrite the files that do
+        old_tag = f"git_release_tag: release-{from_version}".encode("utf-8")
+        new_tag = f"git_release_tag: release-{to_version}".encode("utf-8")
         try:
             # Find and update files
-            for root, _, files in os.walk(params_dir):
-                for file in files:
-                    if file.endswith(f"-{repo}.yml") or file.endswith(f".{repo}.yaml"):
-                        file_path = os.path.join(root, file)
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        if f"git_release_tag: release-{from_version}" in content:
-                            new_content = content.replace(
-                                f"git_release_tag: release-{from_version}",
-                                f"git_release_tag: release-{to_version}",
-                            )
-                            with open(file_path, "w", encoding="utf-8") as f:
-                                f.write(new_content)
+            for file_path in _iter_files(params_dir, suffixes):
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                if old_tag not in data:
+                    continue
+                _replace_file(file_path, data.replace(old_tag, new_tag))
         except (IOError, OSError, PermissionError) as e:
             logger.error(f"Failed to update release tag in params: {e}")
 
@@ -198,6 +434,7 @@ class GitHelper:
 
     def create_and_push_tag(self, repo: str, tag_name: str, tag_message: str) -> bool:
         """Create and push a git tag."""
+        self._tags.pop(self._resolve_repo_dir(repo), None)
         try:
             repo_obj = self._get_repo(repo)
 
@@ -219,12 +456,15 @@ class GitHelper:
         return response.lower().startswith("y")
 
     def tag_exists(self, tag: str, repo: Optional[str] = None) -> bool:
-        """Check if a git tag exists."""
+        """Check if a git tag exists.
+
+        Uses the tags from list_tags when they have been loaded, otherwise reads the ref.
+        """
+        tags = self._tags.get(self._resolve_repo_dir(repo))
+        if tags is not None:
+            return tag in tags
         try:
             repo_obj = self._get_repo(repo)
-            for existing_tag in repo_obj.tags:
-                if existing_tag.name == tag:
-                    return True
-            return False
+            return _ref_exists(repo_obj, f"refs/tags/{tag}")
         except Exception:
             return False
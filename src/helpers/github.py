@@ -3,10 +3,13 @@
 """GitHub API client module for interacting with GitHub's API endpoints."""
 
 import os
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 
 
 class GitHubClient:
@@ -16,6 +19,10 @@ class GitHubClient:
     including managing releases, authentication, and API configuration.
     """
 
+    # Retry policy for rate-limited or failing GET requests
+    max_retries = 5
+    max_backoff = 60
+
     def __init__(
         self,
         api_url: Optional[str] = None,
@@ -61,6 +68,86 @@ class GitHubClient:
         if not self.verify_ssl:
             urllib3.disable_warnings()
 
+        # Reuse connections across API calls instead of a new TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = self.verify_ssl
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Responses with an ETag, keyed by URL and query parameters
+        self._etag_cache: Dict[Tuple, Tuple[str, requests.Response]] = {}
+
+    def close(self) -> None:
+        """Close the pooled connections to the GitHub API."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _should_retry(self, response: requests.Response) -> bool:
+        """Check if a response is a rate limit or server error worth retrying."""
+        if response.status_code == 429 or response.status_code >= 500:
+            return True
+        return response.status_code == 403 and (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+        )
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Work out how long to wait before retrying a request, in seconds.
+
+        Returns:
+            The delay, or None if GitHub asks for a longer wait than max_backoff
+        """
+        retry_after = response.headers.get("Retry-After")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+            delay = float(reset) - time.time()
+        else:
+            return min(2.0**attempt, self.max_backoff)
+        if delay > self.max_backoff:
+            return None
+        return max(0.0, delay)
+
+    def _get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """Send a GET request with conditional caching and retries.
+
+        Responses that carry an ETag are kept and the ETag is sent back as If-None-Match,
+        so an unchanged resource comes back as a 304 that does not count against the rate
+        limit. Rate-limited and server error responses are retried, waiting as long as
+        Retry-After or X-RateLimit-Reset ask for, or backing off exponentially otherwise.
+        A response asking for a longer wait than max_backoff is returned without retrying.
+
+        Returns:
+            The response, or the cached response if GitHub reports it unchanged
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        for attempt in range(self.max_retries):
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                return cached[1]
+            if attempt == self.max_retries - 1 or not self._should_retry(response):
+                break
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            self._etag_cache[key] = (etag, response)
+        return response
+
     def get_latest_release(self, owner: str, repo: str) -> Dict:
         """Get the latest release from GitHub API.
 
@@ -75,7 +162,7 @@ class GitHubClient:
             Exception: If the API request fails
         """
         url = f"{self.api_url}/repos/{owner}/{repo}/releases/latest"
-        response = requests.get(url, verify=self.verify_ssl, headers=self.headers, timeout=10)
+        response = self._get(url)
 
         if response.status_code == 200:
             return response.json()
@@ -100,9 +187,7 @@ class GitHubClient:
         """
         url = f"{self.api_url}/repos/{owner}/{repo}/releases"
         params = {"per_page": per_page}
-        response = requests.get(
-            url, verify=self.verify_ssl, headers=self.headers, params=params, timeout=10
-        )
+        response = self._get(url, params=params)
         if response.status_code == 200:
             return response.json()
         raise requests.exceptions.HTTPError(
@@ -118,23 +203,23 @@ class GitHubClient:
             tag_name: Tag name of the release
 
         Returns:
-            Dict containing release information if found, None otherwise
+            Dict containing release information if found, None otherwise. Draft releases
+            are never found by tag.
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails
             requests.exceptions.Timeout: If the request times out
             requests.exceptions.ConnectionError: If there's a connection error
         """
-        try:
-            releases = self.get_releases(owner, repo)
-            for release in releases:
-                if release.get("tag_name") == tag_name:
-                    return release
+        url = f"{self.api_url}/repos/{owner}/{repo}/releases/tags/{quote(tag_name, safe='')}"
+        response = self._get(url)
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code == 404:
             return None
-        except requests.exceptions.RequestException as e:
-            raise requests.exceptions.RequestException(
-                f"Failed to find release by tag: {str(e)}"
-            ) from e
+        raise requests.exceptions.HTTPError(
+            f"Failed to find release by tag: {response.status_code} - {response.text}"
+        )
 
     def delete_release(self, owner: str, repo: str, release_id: int) -> None:
         """Delete a release by ID.
@@ -148,7 +233,7 @@ class GitHubClient:
             Exception: If the API request fails
         """
         url = f"{self.api_url}/repos/{owner}/{repo}/releases/{release_id}"
-        response = requests.delete(url, verify=self.verify_ssl, headers=self.headers, timeout=10)
+        response = self.session.delete(url, timeout=10)
         if response.status_code != 204:
             raise requests.exceptions.HTTPError(
                 f"Failed to delete release: {response.status_code} - {response.text}"
@@ -191,9 +276,7 @@ class GitHubClient:
             "prerelease": prerelease,
         }
 
-        response = requests.post(
-            url, verify=self.verify_ssl, headers=self.headers, json=payload, timeout=10
-        )
+        response = self.session.post(url, json=payload, timeout=10)
 
         if response.status_code in (200, 201):
             return response.json()
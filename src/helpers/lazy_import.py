@@ -0,0 +1,42 @@
+"""Deferred imports for the command line entry points.
+
+GitPython and requests take most of a script's startup time. Scripts list the helpers
+that depend on them here so that argument parsing and ``--help`` do not import them.
+"""
+
+import importlib
+from typing import Any, Dict
+
+
+class LazyImports:
+    """Import names into a module namespace on first use.
+
+    An instance is meant to be assigned to a module's ``__getattr__`` (PEP 562), so
+    ``module.Name`` keeps working for callers and for ``unittest.mock.patch``.
+    """
+
+    def __init__(self, namespace: Dict[str, Any], imports: Dict[str, str]) -> None:
+        """Initialize the lazy imports.
+
+        Args:
+            namespace: The ``globals()`` of the module the names are imported into
+            imports: Mapping of name to the module that defines it
+        """
+        self.namespace = namespace
+        self.imports = imports
+
+    def __call__(self, name: str) -> Any:
+        """Import a single name, keeping any value already bound in the namespace."""
+        if name in self.namespace:
+            return self.namespace[name]
+        if name not in self.imports:
+            raise AttributeError(
+                f"module {self.namespace.get('__name__')!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(self.imports[name]), name)
+        return self.namespace.setdefault(name, value)
+
+    def load(self) -> None:
+        """Import every deferred name so it can be referenced as a module global."""
+        for name in self.imports:
+            self(name)
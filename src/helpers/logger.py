@@ -21,22 +21,39 @@ class ColorFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """Initialize the formatter.
+
+        Args:
+            fmt: The log format string
+            datefmt: The date format string
+        """
+        super().__init__(fmt, datefmt)
+        # A formatter per level with the color codes already around the format string,
+        # so each record is formatted in a single pass
+        reset = self.COLORS["RESET"]
+        self._level_formatters = {
+            level: logging.Formatter(f"{color}{self._fmt}{reset}", datefmt)
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
+
     def format(self, record):
         """Format the log record with color."""
-        # Get the original formatted message
-        log_message = super().format(record)
-
-        # Add color based on level
-        level_name = record.levelname
-        color = self.COLORS.get(level_name, self.COLORS["RESET"])
-        return f"{color}{log_message}{self.COLORS['RESET']}"
+        formatter = self._level_formatters.get(record.levelname)
+        if formatter is None:
+            reset = self.COLORS["RESET"]
+            return f"{reset}{super().format(record)}{reset}"
+        return formatter.format(record)
 
 
 class Logger:
     """Logger class for pipeline helpers.
 
     This class provides standardized logging capabilities for the pipeline helpers,
-    supporting both console and file logging with configurable log levels.
+    supporting both console and file logging with configurable log levels. As with the
+    logging module, extra arguments are %-formatted into the message only when the
+    message is actually emitted.
     """
 
     def __init__(
@@ -58,8 +75,11 @@ class Logger:
         self.logger.setLevel(level)
         self.logger.handlers = []  # Clear any existing handlers
 
-        # Create formatters
-        console_formatter = ColorFormatter("%(message)s")
+        # Create formatters, leaving out the color codes when stdout isn't a terminal
+        if sys.stdout.isatty():
+            console_formatter = ColorFormatter("%(message)s")
+        else:
+            console_formatter = logging.Formatter("%(message)s")
         file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
         # Add console handler if requested
@@ -79,30 +99,30 @@ class Logger:
             file_handler.setFormatter(file_formatter)
             self.logger.addHandler(file_handler)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log a debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log an info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log a warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log an error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """Log a critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
 
-    def success(self, message: str) -> None:
+    def success(self, message: str, *args) -> None:
         """Log a success message (uses INFO level with special formatting)."""
         # Use info level but with success formatting
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
 
 # Create a default logger instance
@@ -110,39 +130,39 @@ default_logger = Logger()
 
 
 # Convenience functions that use the default logger
-def debug(message: str) -> None:
+def debug(message: str, *args) -> None:
     """Log a debug message using the default logger."""
-    default_logger.debug(message)
+    default_logger.debug(message, *args)
 
 
-def info(message: str) -> None:
+def info(message: str, *args) -> None:
     """Log an info message using the default logger."""
-    default_logger.info(message)
+    default_logger.info(message, *args)
 
 
-def warning(message: str) -> None:
+def warning(message: str, *args) -> None:
     """Log a warning message using the default logger."""
-    default_logger.warning(message)
+    default_logger.warning(message, *args)
 
 
-def warn(message: str) -> None:
+def warn(message: str, *args) -> None:
     """Alias for warning using the default logger."""
-    default_logger.warning(message)
+    default_logger.warning(message, *args)
 
 
-def error(message: str) -> None:
+def error(message: str, *args) -> None:
     """Log an error message using the default logger."""
-    default_logger.error(message)
+    default_logger.error(message, *args)
 
 
-def critical(message: str) -> None:
+def critical(message: str, *args) -> None:
     """Log a critical message using the default logger."""
-    default_logger.critical(message)
+    default_logger.critical(message, *args)
 
 
-def success(message: str) -> None:
+def success(message: str, *args) -> None:
     """Log a success message using the default logger."""
-    default_logger.success(message)
+    default_logger.success(message, *args)
 
 
 def configure(
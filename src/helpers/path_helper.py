@@ -6,6 +6,15 @@ class RepositoryPathHelper:
     A helper class to adjust repository and params repository paths based on the owner.
     """
 
+    __slots__ = (
+        "git_dir",
+        "owner",
+        "_git_dir_prefix",
+        "_owner_suffix",
+        "_is_default_owner",
+        "_adjusted",
+    )
+
     def __init__(self, git_dir, owner="Utilities-tkgieng"):
         """
         Initialize the CommandHelper.
@@ -16,6 +25,12 @@ class RepositoryPathHelper:
         """
         self.git_dir = git_dir
         self.owner = owner
+        # git_dir with exactly one trailing separator, so repo names can be appended directly
+        self._git_dir_prefix = os.path.join(git_dir, "")
+        self._owner_suffix = f"-{owner}"
+        self._is_default_owner = owner == "Utilities-tkgieng"
+        # _adjust_path results by name; they depend only on git_dir and owner
+        self._adjusted = {}
 
     def adjust_path(self, repo):
         """
@@ -55,6 +70,25 @@ class RepositoryPathHelper:
 
         return repo, repo_dir, params_repo, params_dir
 
+    def pipeline_names(self, repo, foundation):
+        """
+        Works out the Concourse pipeline names for a repo, including any owner suffix.
+
+        Args:
+          repo (str): The repository name.
+          foundation (str): The foundation name.
+
+        Returns:
+          tuple: The release, set-release and management pipeline names.
+        """
+        suffix = "" if self._is_default_owner else self._owner_suffix
+        mgmt_pipeline = f"tkgi-{repo}{suffix}-{foundation}"
+        return (
+            f"tkgi-{repo}{suffix}-release",
+            f"{mgmt_pipeline}-set-release-pipeline",
+            mgmt_pipeline,
+        )
+
     def _adjust_path(self, name):
         """
         Adjusts a single path based on the owner.
@@ -65,18 +99,26 @@ class RepositoryPathHelper:
         Returns:
           tuple: Adjusted name and directory path.
         """
-        name_without_owner = None
-        if name.endswith(self.owner):
-            name_without_owner = name[: -len(self.owner) - 1]
+        if name not in self._adjusted:
+            self._adjusted[name] = self._compute_path(name)
+        return self._adjusted[name]
 
-        if name_without_owner:
-            # name = name_without_owner
-            dir_path = os.path.join(self.git_dir, name_without_owner)
-        else:
-            dir_path = os.path.join(self.git_dir, name)
+    def _compute_path(self, name):
+        """
+        Works out the adjusted name and directory path for _adjust_path.
+
+        Args:
+          name (str): The name of the repository or params repository.
 
-        if self.owner != "Utilities-tkgieng":
-            # name = f"{name}-{self.owner}"
-            dir_path = os.path.join(self.git_dir, f"{name}-{self.owner}")
+        Returns:
+          tuple: Adjusted name and directory path.
+        """
+        if not self._is_default_owner:
+            # Other owners' clones live next to ours with the owner appended
+            dir_name = f"{name}{self._owner_suffix}"
+        elif name.endswith(self._owner_suffix):
+            dir_name = name[: -len(self._owner_suffix)] or name
+        else:
+            dir_name = name
 
-        return name, dir_path
+        return name, self._git_dir_prefix + dir_name
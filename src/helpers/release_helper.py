@@ -3,8 +3,9 @@
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import git
 import requests
@@ -32,6 +33,9 @@ except ImportError:
         def delete_release(self, owner, repo, release_id):
             return True
 
+        def close(self):
+            pass
+
 
 class ReleaseHelper:
     """Helper class for managing releases.
@@ -83,6 +87,10 @@ class ReleaseHelper:
             params_dir=self.params_dir,
         )
         self.github_client = GitHubClient(token=token)
+        self._releases: Optional[List[Dict]] = None
+        # The cached releases keyed by tag name, for lookups by tag
+        self._releases_by_tag: Dict[str, Dict] = {}
+        self._releases_lock = threading.Lock()
         self.release_pipeline = release_pipeline or f"tkgi-{self.repo}-release"
         set_pipeline = set_pipeline or f"tkgi-{self.repo}-{self.foundation}-set-release-pipeline"
         mgmt_pipeline = mgmt_pipeline or f"tkgi-{self.repo}-{self.foundation}"
@@ -90,6 +98,17 @@ class ReleaseHelper:
         if not self.git_helper.check_git_repo():
             raise ValueError("Repository is not a git repository")
 
+    def close(self) -> None:
+        """Release the GitHub client's pooled connections and the opened repositories."""
+        self.github_client.close()
+        self.git_helper.close()
+
+    def __enter__(self) -> "ReleaseHelper":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def get_latest_release_tag(self) -> str:
         """Get the latest release tag from git."""
         self.git_helper.pull_all()
@@ -128,14 +147,25 @@ class ReleaseHelper:
         tag = self.get_latest_release_tag()
         return tag.replace(filter, "")
 
-    def get_releases(self) -> Optional[List[str]]:
-        """Get all releases for the repository."""
+    def get_releases(self) -> Optional[List[Dict]]:
+        """Get all releases for the repository.
+
+        The list is fetched from GitHub once and reused by later calls on this helper.
+        """
         try:
-            return self.github_client.get_releases(self.owner, self.repo)
+            return self._load_releases()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching releases: {str(e)}")
             return None
 
+    def _load_releases(self) -> List[Dict]:
+        """Fetch the releases from GitHub unless they have already been fetched."""
+        if self._releases is None:
+            releases = self.github_client.get_releases(self.owner, self.repo)
+            self._releases_by_tag = {r.get("tag_name"): r for r in releases}
+            self._releases = releases
+        return self._releases
+
     def validate_release_param(self, param: str, filter: str = "release-v") -> bool:
         """Validate a release parameter format."""
         if not param:
@@ -180,13 +210,34 @@ class ReleaseHelper:
         return 0
 
     def get_github_release_by_tag(self, release_tag: str) -> Optional[dict]:
-        """Get a GitHub release by tag."""
+        """Get a GitHub release by tag, logging an error if GitHub could not be asked."""
         try:
-            return self.github_client.find_release_by_tag(self.owner, self.repo, release_tag)
+            return self.find_github_release_by_tag(release_tag)
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get release by tag: {e}")
             return None
 
+    def find_github_release_by_tag(self, release_tag: str) -> Optional[dict]:
+        """Find a GitHub release by tag.
+
+        Uses the cached release list when it has the tag. The list only holds GitHub's first
+        page of releases, so any other tag is asked for directly. GitHub only serves
+        published releases by tag, so a draft is looked for in the release list instead.
+
+        Returns:
+            The release, or None if there is no release for the tag
+
+        Raises:
+            requests.exceptions.RequestException: If the release could not be looked up
+        """
+        release = self._releases_by_tag.get(release_tag)
+        if release is not None:
+            return release
+        release = self.github_client.find_release_by_tag(self.owner, self.repo, release_tag)
+        if release is None and self._load_releases():
+            release = self._releases_by_tag.get(release_tag)
+        return release
+
     def delete_release_tag(self, release_tag: str) -> bool:
         """Delete a release tag from the repository.
 
@@ -196,18 +247,35 @@ class ReleaseHelper:
         Returns:
             bool: True if the tag was deleted successfully, False otherwise
         """
+        return self.delete_release_tags([release_tag])
+
+    def delete_release_tags(self, release_tags: List[str]) -> bool:
+        """Delete release tags from the repository.
+
+        The tags are deleted on the remote with a single push.
+
+        Args:
+            release_tags (List[str]): The tags to delete
+
+        Returns:
+            bool: True if the tags were deleted successfully, False otherwise
+        """
         try:
             self.git_helper.pull()
-            self.git_helper.delete_tag(release_tag)
-            return True
+            return self.git_helper.delete_tags(release_tags)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to delete tag {release_tag}: {e}")
+            logger.error(f"Failed to delete tags {', '.join(release_tags)}: {e}")
             return False
 
     def delete_github_release(self, release_id: str) -> bool:
         """Delete a GitHub release."""
         try:
             self.github_client.delete_release(self.owner, self.repo, release_id)
+            # Releases may be deleted from several threads at once
+            with self._releases_lock:
+                if self._releases is not None:
+                    self._releases = [r for r in self._releases if r.get("id") != release_id]
+                    self._releases_by_tag = {r.get("tag_name"): r for r in self._releases}
             return True
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to delete release: {e}")
@@ -217,9 +285,7 @@ class ReleaseHelper:
         """Get all release tags from the params repo."""
         try:
             self.git_helper.pull_all(repo=self.params_repo)
-            repo = git.Repo(self.params_dir)
-            tags = [tag.name for tag in repo.tags]
-            return tags
+            return list(self.git_helper.list_tags(repo=self.params_repo))
         except Exception as e:
             logger.error(f"Failed to get params release tags: {e}")
             return []
@@ -349,12 +415,8 @@ class ReleaseHelper:
             )
 
             # Unpause and trigger pipeline using the concourse client
-            self.concourse_client.unpause_pipeline("tkgi-pipeline-upgrade", self.release_pipeline)
-            self.concourse_client.trigger_job(
-                "tkgi-pipeline-upgrade", f"{self.release_pipeline}/create-final-release"
-            )
-            self.concourse_client.watch_job(
-                "tkgi-pipeline-upgrade", f"{self.release_pipeline}/create-final-release"
+            self.concourse_client.run_and_watch(
+                "tkgi-pipeline-upgrade", self.release_pipeline, "create-final-release"
             )
 
             input("Press enter to continue")
@@ -391,9 +453,8 @@ class ReleaseHelper:
             )
 
             # Unpause and trigger pipeline using the concourse client
-            self.concourse_client.unpause_pipeline(foundation, self.set_pipeline)
-            self.concourse_client.trigger_job(
-                foundation, f"{self.set_pipeline}/set-release-pipeline", watch=True
+            self.concourse_client.run_and_watch(
+                foundation, self.set_pipeline, "set-release-pipeline"
             )
 
             input("Press enter to continue")
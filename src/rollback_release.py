@@ -77,13 +77,11 @@ def main() -> None:
 
     release_helper = ReleaseHelper(repo=repo, owner=args.owner, params_repo=params_repo)
 
-    # Change to the repo's ci directory
+    # fly scripts are run from the repo's ci directory via cwd=, so there is no chdir
     ci_dir = os.path.expanduser(f"~/git/{repo}/ci")
     if not os.path.exists(ci_dir):
         raise ValueError(f"CI directory not found at {ci_dir}")
 
-    os.chdir(ci_dir)
-
     # Validate release tag
     release_tag = f"{repo}-{args.release}"
     if not release_helper.validate_params_release_tag(release_tag):
@@ -104,7 +104,6 @@ def main() -> None:
         params_dir=params_dir,
         params_repo=params_repo,
     )
-    os.chdir(repo_dir)
 
     if not release_helper.update_params_git_release_tag("v"):
         raise ValueError("Failed to update git release tag")
@@ -1,5 +1,6 @@
 import os
 import sys
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -8,116 +9,13 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 # Import the function from the module
-from src.create_release import CustomHelpFormatter, parse_args
-
-
-# Create an undecorated version of the main function for testing
-def main_test_function():
-    """
-    This is a copy of the main function without the wrapper for testing purposes.
-    Must be kept in sync with the original in src/create_release.py
-    """
-    import os
-    import subprocess
-
-    from src.create_release import (
-        ConcourseClient,
-        GitHelper,
-        ReleaseHelper,
-        logger,
-    )
-
-    args = parse_args()
-
-    # Setup error logging is now handled by the wrap_main decorator
-
-    # Process the repo and params values
-    repo = args.repo
-    params_repo = args.params_repo
-    release_pipeline = f"tkgi-{repo}-release"
-
-    logger.info(f"Creating release for repo: {repo}")
-    logger.info(f"Foundation: {args.foundation}")
-
-    if args.owner != "Utilities-tkgieng":
-        repo = f"{repo}-{args.owner}"
-        params_repo = f"{params_repo}-{args.owner}"
-        release_pipeline = f"tkgi-{repo}-release"
-
-    # Initialize helpers
-    git_helper = GitHelper(repo=repo)
-    if not git_helper.check_git_repo():
-        raise ValueError("Git is not installed or not in PATH")
-
-    release_pipeline = f"tkgi-{repo}-release"
-    if args.owner != "Utilities-tkgieng":
-        release_pipeline = f"tkgi-{repo}-{args.owner}-release"
-
-    git_dir = os.path.expanduser("~/git")
-    release_helper = ReleaseHelper(
-        foundation=args.foundation,
-        repo=repo,
-        owner=args.owner,
-        params_repo=params_repo,
-        git_dir=git_dir,
-        release_pipeline=release_pipeline,
-    )
-    concourse_client = ConcourseClient()
-
-    # Change to the repo's ci directory
-    ci_dir = os.path.expanduser(f"~/git/{repo}/ci")
-    if not os.path.exists(ci_dir):
-        raise ValueError(f"CI directory not found at {ci_dir}")
-
-    if args.dry_run:
-        logger.info("DRY RUN MODE - No changes will be made")
-        logger.info(f"Would change to directory: {ci_dir}")
-        logger.info(f"Would run release pipeline: {release_pipeline}")
-        logger.info("Would update git release tag")
-        return
-    else:
-        os.chdir(ci_dir)
-        logger.info(f"Changed to directory: {ci_dir}")
-
-    # Run release pipeline
-    if not release_helper.run_release_pipeline(args.foundation, args.message):
-        raise ValueError("Failed to run release pipeline")
-
-    # Update git release tag
-    if not release_helper.update_params_git_release_tag():
-        raise ValueError("Failed to update git release tag")
-
-    # Run set pipeline
-    if not release_helper.run_set_pipeline(args.foundation):
-        raise ValueError("Failed to run set pipeline")
-
-    # Ask user if they want to trigger a job
-    trigger_response = input("Do you want to trigger a prepare-kustomizations job? [y/N] ")
-    if trigger_response.lower().startswith("y"):
-        concourse_client.trigger_job(
-            args.foundation, f"tkgi-{repo}-{args.foundation}/prepare-kustomizations", watch=True
-        )
-
-    # Ask user if they want to run fly.sh script
-    fly_script_response = input("Do you want to run the fly.sh script? [y/N] ")
-    if fly_script_response.lower().startswith("y"):
-        # Get current branch
-        current_branch = git_helper.get_current_branch()
-        # Build the path to fly.sh
-        fly_script_path = f"{ci_dir}/fly.sh"
-        # Run fly.sh script
-        subprocess.run(
-            [
-                fly_script_path,
-                "-f",
-                args.foundation,
-                "-b",
-                current_branch,
-            ],
-            check=True,
-        )
-
-    logger.info("Release process completed successfully")
+from src.create_release import (
+    CustomHelpFormatter,
+    _build_parser,
+    confirm_follow_up_steps,
+    main,
+    parse_args,
+)
 
 
 def test_parse_args():
@@ -162,6 +60,49 @@ def test_parse_args():
         assert args.params_repo == "custom-params"
         assert args.dry_run
 
+    # Test with an explicit argument list instead of sys.argv
+    with patch("sys.argv", ["create_release.py"]):
+        args = parse_args(["-f", "foundation3", "-r", "repo3", "--dry-run"])
+        assert args.foundation == "foundation3"
+        assert args.repo == "repo3"
+        assert args.dry_run
+
+    # The workspace default follows GIT_WORKSPACE at the time of parsing
+    for workspace in ("/tmp/workspace1", "/tmp/workspace2"):
+        with patch.dict(os.environ, {"GIT_WORKSPACE": workspace}):
+            assert parse_args(["-f", "foundation", "-r", "repo"]).git_dir == workspace
+    assert parse_args(["-f", "foundation", "-r", "repo", "-w", "/tmp/dir"]).git_dir == "/tmp/dir"
+
+
+def test_parse_error_leaves_parser_unchanged(capsys):
+    # The parser is shared between parses, so reporting an error must not alter it
+    for _ in range(2):
+        with pytest.raises(SystemExit):
+            parse_args(["-f", "foundation"])
+        captured = capsys.readouterr()
+        assert captured.err.startswith("Error: the following arguments are required: -r")
+        assert captured.out.count("Usage:") == 1
+
+    _build_parser().print_usage()
+    assert "Usage:" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "answers,expected",
+    [
+        (["yy"], (True, True)),
+        (["yn"], (True, False)),
+        ([" NY "], (False, True)),
+        ([""], (False, False)),
+        # Anything other than one y or n per step is asked again
+        (["yes", "y", "ny"], (False, True)),
+    ],
+)
+def test_confirm_follow_up_steps(answers, expected):
+    with patch("builtins.input", side_effect=answers) as mock_input:
+        assert confirm_follow_up_steps() == expected
+        assert mock_input.call_count == len(answers)
+
 
 def test_custom_help_formatter():
     # Create a formatter with a mocked parser
@@ -175,291 +116,171 @@ def test_custom_help_formatter():
     assert hasattr(formatter, "format_help")
 
 
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-def test_main_with_dry_run(
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_git_helper.return_value.get_current_branch.return_value = "develop"
-    mock_exists.return_value = True
-
-    # Mock args
-    with patch("sys.argv", ["create_release.py", "-f", "foundation", "-r", "repo", "--dry-run"]):
-        # Run the test version of the function
-        main_test_function()
-
-        # Verify logger calls to confirm dry run behavior
-        assert mock_logger.info.call_count >= 3
-        mock_logger.info.assert_any_call("DRY RUN MODE - No changes will be made")
-
-        # Verify no actual operations were performed
-        mock_release_helper.return_value.run_release_pipeline.assert_not_called()
-        mock_release_helper.return_value.update_params_git_release_tag.assert_not_called()
-        mock_release_helper.return_value.run_set_pipeline.assert_not_called()
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-@patch("os.chdir")
-def test_main_success_flow(
-    mock_chdir,
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_git_helper.return_value.get_current_branch.return_value = "develop"
-    mock_exists.return_value = True
-    mock_release_helper.return_value.run_release_pipeline.return_value = True
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
-    mock_release_helper.return_value.run_set_pipeline.return_value = True
-
-    # Mock user input
-    with patch("builtins.input", side_effect=["n", "n"]):
-        with patch(
-            "sys.argv",
-            ["create_release.py", "-f", "foundation", "-r", "repo", "-m", "Test release"],
-        ):
-            # Run the test version of the function
-            main_test_function()
-
-            # Verify the workflow
-            mock_chdir.assert_called_once()
-            mock_release_helper.return_value.run_release_pipeline.assert_called_once_with(
-                "foundation", "Test release"
-            )
-            mock_release_helper.return_value.update_params_git_release_tag.assert_called_once()
-            mock_release_helper.return_value.run_set_pipeline.assert_called_once_with("foundation")
-
-            # Check concourse client not used (since we mock user input to 'n')
-            mock_concourse.return_value.trigger_job.assert_not_called()
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-def test_main_ci_dir_not_found(
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks - CI directory doesn't exist
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_exists.return_value = False
-
-    with patch("sys.argv", ["create_release.py", "-f", "foundation", "-r", "repo"]):
-        # We expect a ValueError to be raised
-        with pytest.raises(ValueError) as excinfo:
-            main_test_function()
-
-        # Verify error message
-        assert "CI directory not found" in str(excinfo.value)
-
-        # Verify no operations were performed
-        mock_release_helper.return_value.run_release_pipeline.assert_not_called()
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-@patch("os.chdir")
-def test_main_pipeline_failure(
-    mock_chdir,
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_exists.return_value = True
-    # Make run_release_pipeline fail
-    mock_release_helper.return_value.run_release_pipeline.return_value = False
-
-    with patch("sys.argv", ["create_release.py", "-f", "foundation", "-r", "repo"]):
-        with pytest.raises(ValueError) as excinfo:
-            main_test_function()
-
-        # Verify error message
-        assert "Failed to run release pipeline" in str(excinfo.value)
-
-        # Verify no further operations were performed
-        mock_release_helper.return_value.update_params_git_release_tag.assert_not_called()
-        mock_release_helper.return_value.run_set_pipeline.assert_not_called()
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-@patch("os.chdir")
-@patch("subprocess.run")
-def test_main_with_fly_script(
-    mock_subprocess,
-    mock_chdir,
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_git_helper.return_value.get_current_branch.return_value = "develop"
-    mock_exists.return_value = True
-    mock_release_helper.return_value.run_release_pipeline.return_value = True
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
-    mock_release_helper.return_value.run_set_pipeline.return_value = True
-
-    # Mock the CI directory path
-    mock_ci_dir = "/tmp/repo/ci"
-
-    # Patch expanduser to return our mock path
-    with patch("os.path.expanduser", return_value=mock_ci_dir):
-        # Mock user input to say 'yes' to running fly script
-        with patch("builtins.input", side_effect=["n", "y"]):
-            with patch("sys.argv", ["create_release.py", "-f", "foundation", "-r", "repo"]):
-                # Run the test version of the function
-                main_test_function()
-
-                # Verify subprocess was called with the right params
-                mock_subprocess.assert_called_once()
-                call_args = mock_subprocess.call_args[0][0]
-                assert call_args[0] == f"{mock_ci_dir}/fly.sh"
-                assert "-f" in call_args
-                assert "foundation" in call_args
-                assert "-b" in call_args
-                assert "develop" in call_args
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-@patch("os.chdir")
-def test_main_with_concourse_trigger(
-    mock_chdir,
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_git_helper.return_value.get_current_branch.return_value = "develop"
-    mock_exists.return_value = True
-    mock_release_helper.return_value.run_release_pipeline.return_value = True
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
-    mock_release_helper.return_value.run_set_pipeline.return_value = True
-
-    # Mock user input to say 'yes' to triggering Concourse job
-    with patch("builtins.input", side_effect=["y", "n"]):
-        with patch("sys.argv", ["create_release.py", "-f", "foundation", "-r", "repo"]):
-            # Run the test version of the function
-            main_test_function()
-
-            # Verify Concourse client was called to trigger the job
-            mock_concourse.return_value.trigger_job.assert_called_once_with(
-                "foundation", "tkgi-repo-foundation/prepare-kustomizations", watch=True
-            )
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-def test_main_git_error(mock_git_helper, mock_setup_logging, mock_logger):
-    # Setup mock to simulate git not available
-    mock_git_helper.return_value.check_git_repo.return_value = False
-
-    with patch("sys.argv", ["create_release.py", "-f", "foundation", "-r", "repo"]):
-        with pytest.raises(ValueError) as excinfo:
-            main_test_function()
-
-        # Verify error message
-        assert "Git is not installed or not in PATH" in str(excinfo.value)
-
-
-@patch("src.create_release.logger")  # Mock the logger
-@patch("src.helpers.error_handler.setup_error_logging")  # Mock setup_error_logging
-@patch("src.create_release.GitHelper")
-@patch("src.create_release.ReleaseHelper")
-@patch("src.create_release.ConcourseClient")
-@patch("os.path.exists")
-@patch("os.chdir")
-def test_main_with_custom_owner(
-    mock_chdir,
-    mock_exists,
-    mock_concourse,
-    mock_release_helper,
-    mock_git_helper,
-    mock_setup_logging,
-    mock_logger,
-):
-    # Setup mocks
-    mock_git_helper.return_value.check_git_repo.return_value = True
-    mock_exists.return_value = True
-    mock_release_helper.return_value.run_release_pipeline.return_value = True
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
-    mock_release_helper.return_value.run_set_pipeline.return_value = True
-
-    # Need to mock input to avoid the stdin read error
-    with patch("builtins.input", side_effect=["n", "n"]):
-        with patch(
-            "sys.argv",
-            ["create_release.py", "-f", "foundation", "-r", "repo", "-o", "custom-owner"],
-        ):
-            # Run the test version of the function
-            main_test_function()
-
-            # Verify GitHelper was called with the correct repo name
-            mock_git_helper.assert_called_with(repo="repo-custom-owner")
-
-            # Verify ReleaseHelper was called with the correct parameters
-            mock_release_helper.assert_called_with(
-                foundation="foundation",
-                repo="repo-custom-owner",
-                owner="custom-owner",
-                params_repo="params-custom-owner",
-                git_dir=os.path.expanduser("~/git"),
-                release_pipeline="tkgi-repo-custom-owner-custom-owner-release",
-            )
-
-
-# Note: Environment variable based logging is now tested elsewhere
+@pytest.fixture
+def workspace(tmp_path):
+    """Create a git workspace with a repo, its ci directory and a params repo."""
+    (tmp_path / "repo" / "ci").mkdir(parents=True)
+    (tmp_path / "params").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def helpers():
+    """Mock out the helpers that main creates, and the logger."""
+    with patch("src.create_release.GitHelper") as mock_git_helper, patch(
+        "src.create_release.ReleaseHelper"
+    ) as mock_release_helper, patch("src.create_release.ConcourseClient") as mock_concourse, patch(
+        "src.create_release.logger"
+    ) as mock_logger:
+        mock_git_helper.return_value.check_git_repo.return_value = True
+        mock_git_helper.return_value.get_current_branch.return_value = "develop"
+        release_helper = mock_release_helper.return_value
+        release_helper.run_release_pipeline.return_value = True
+        release_helper.update_params_git_release_tag.return_value = True
+        release_helper.run_set_pipeline.return_value = True
+        yield SimpleNamespace(
+            git_helper=mock_git_helper,
+            release_helper=mock_release_helper,
+            concourse=mock_concourse,
+            logger=mock_logger,
+        )
+
+
+def run_main(workspace, *args):
+    """Run the undecorated main for repo in the workspace, so errors are raised."""
+    main.__wrapped__(["-f", "foundation", "-r", "repo", "-w", str(workspace), *args])
+
+
+def test_main_with_dry_run(workspace, helpers):
+    run_main(workspace, "--dry-run")
+
+    # Verify logger calls to confirm dry run behavior
+    helpers.logger.info.assert_any_call("DRY RUN MODE - No changes will be made")
+
+    # Verify no actual operations were performed
+    helpers.release_helper.assert_not_called()
+    helpers.concourse.assert_not_called()
+
+
+def test_main_success_flow(workspace, helpers):
+    with patch("builtins.input", return_value="nn"):
+        run_main(workspace, "-m", "Test release")
+
+    helpers.release_helper.assert_called_once_with(
+        foundation="foundation",
+        repo="repo",
+        git_dir=str(workspace),
+        repo_dir=os.path.join(workspace, "repo"),
+        owner="Utilities-tkgieng",
+        params_dir=os.path.join(workspace, "params"),
+        params_repo="params",
+        release_pipeline="tkgi-repo-release",
+        set_pipeline="tkgi-repo-foundation-set-release-pipeline",
+        mgmt_pipeline="tkgi-repo-foundation",
+    )
+    release_helper = helpers.release_helper.return_value
+    release_helper.run_release_pipeline.assert_called_once_with("foundation", "Test release")
+    release_helper.update_params_git_release_tag.assert_called_once()
+    release_helper.run_set_pipeline.assert_called_once_with("foundation")
+
+    # Both follow-up steps were declined
+    helpers.concourse.return_value.trigger_job.assert_not_called()
+    helpers.logger.info.assert_any_call("Skipping the prepare-kustomizations job")
+    helpers.logger.info.assert_any_call("Skipping fly.sh")
+
+
+def test_main_repo_dir_not_found(tmp_path, helpers):
+    with pytest.raises(ValueError, match="Could not find repo directory"):
+        run_main(tmp_path)
+
+    helpers.git_helper.assert_not_called()
+
+
+def test_main_ci_dir_not_found(workspace, helpers):
+    (workspace / "repo" / "ci").rmdir()
+
+    with pytest.raises(ValueError, match="CI directory not found"):
+        run_main(workspace)
+
+    # Verify no operations were performed
+    helpers.release_helper.assert_not_called()
+
+
+def test_main_pipeline_failure(workspace, helpers):
+    release_helper = helpers.release_helper.return_value
+    release_helper.run_release_pipeline.return_value = False
+
+    with pytest.raises(ValueError, match="Failed to run release pipeline"):
+        run_main(workspace)
+
+    # Verify no further operations were performed
+    release_helper.update_params_git_release_tag.assert_not_called()
+    release_helper.run_set_pipeline.assert_not_called()
+
+
+def test_main_with_fly_script(workspace, helpers):
+    ci_dir = os.path.join(workspace, "repo", "ci")
+
+    with patch("builtins.input", return_value="ny"), patch(
+        "src.create_release.subprocess.run"
+    ) as mock_subprocess:
+        run_main(workspace)
+
+    mock_subprocess.assert_called_once_with(
+        [f"{ci_dir}/fly.sh", "-f", "foundation", "-b", "develop"], cwd=ci_dir, check=True
+    )
+    helpers.concourse.return_value.trigger_job.assert_not_called()
+
+
+def test_main_with_concourse_trigger(workspace, helpers):
+    with patch("builtins.input", return_value="yn"), patch(
+        "src.create_release.subprocess.run"
+    ) as mock_subprocess:
+        run_main(workspace)
+
+    helpers.concourse.return_value.trigger_job.assert_called_once_with(
+        "foundation", "tkgi-repo-foundation/prepare-kustomizations", watch=True
+    )
+    mock_subprocess.assert_not_called()
+
+
+def test_main_git_error(workspace, helpers):
+    helpers.git_helper.return_value.check_git_repo.return_value = False
+
+    with pytest.raises(ValueError, match="repo is not a git repository"):
+        run_main(workspace)
+
+    helpers.release_helper.assert_not_called()
+
+
+def test_main_with_custom_owner(workspace, helpers):
+    (workspace / "repo-custom-owner" / "ci").mkdir(parents=True)
+    (workspace / "params-custom-owner").mkdir()
+
+    with patch("builtins.input", return_value="yn"):
+        run_main(workspace, "-o", "custom-owner")
+
+    # The other owner's clones are used, and its pipelines carry the owner
+    helpers.git_helper.assert_called_once_with(
+        git_dir=str(workspace),
+        repo="repo",
+        repo_dir=os.path.join(workspace, "repo-custom-owner"),
+        params="params",
+        params_dir=os.path.join(workspace, "params-custom-owner"),
+    )
+    release_kwargs = helpers.release_helper.call_args.kwargs
+    assert release_kwargs["owner"] == "custom-owner"
+    assert release_kwargs["release_pipeline"] == "tkgi-repo-custom-owner-release"
+    helpers.concourse.return_value.trigger_job.assert_called_once_with(
+        "foundation", "tkgi-repo-custom-owner-foundation/prepare-kustomizations", watch=True
+    )
+
+
+def test_main_reports_errors_and_exits(tmp_path, helpers):
+    with patch("src.helpers.error_handler.setup_error_logging", return_value=None), patch(
+        "src.helpers.error_handler.logger"
+    ):
+        with pytest.raises(SystemExit) as excinfo:
+            main(["-f", "foundation", "-r", "repo", "-w", str(tmp_path)])
+
+    assert excinfo.value.code == 1
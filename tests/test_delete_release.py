@@ -1,12 +1,21 @@
 import os
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
+from git import Remote
 
 sys.path.insert(0, "../src")  # This ensures src directory is in path
 
-from src.delete_release import delete_git_tag, main, parse_args, print_available_releases
+from src.delete_release import (
+    delete_git_tag,
+    delete_releases,
+    main,
+    parse_args,
+    print_available_releases,
+)
+from src.helpers.git_helper import GitHelper
 from src.helpers.release_helper import ReleaseHelper
 
 
@@ -25,11 +34,16 @@ def test_parse_args():
     with patch("sys.argv", ["delete_release.py", "-r", "repo", "-t", "v1.0.0"]):
         args = parse_args()
         assert args.repo == "repo"
-        assert args.tag == "v1.0.0"
+        assert args.tag == ["v1.0.0"]
         assert args.owner == "Utilities-tkgieng"
         assert not args.no_tag_deletion
         assert not args.non_interactive
 
+    # Test with multiple tags
+    with patch("sys.argv", ["delete_release.py", "-r", "repo", "-t", "v1.0.0", "v1.1.0"]):
+        args = parse_args()
+        assert args.tag == ["v1.0.0", "v1.1.0"]
+
     # Test with custom owner
     test_args = ["delete_release.py", "-r", "repo", "-t", "v1.0.0", "-o", "custom-owner"]
     with patch("sys.argv", test_args):
@@ -189,7 +203,7 @@ def test_no_releases_found():
 
             # Check that info was called with "No releases found"
             mock_logger_info.assert_any_call("No releases found")
-            mock_release_helper.return_value.delete_release_tag.assert_called_once_with(tag)
+            mock_release_helper.return_value.delete_release_tags.assert_called_once_with([tag])
 
 
 def test_successful_deletion():
@@ -222,7 +236,7 @@ def test_successful_deletion():
             mock_release_helper.return_value.delete_github_release.assert_called_once_with(
                 mock_release.get("id")
             )
-            mock_release_helper.return_value.delete_release_tag.assert_called_once_with(tag)
+            mock_release_helper.return_value.delete_release_tags.assert_called_once_with([tag])
 
 
 def test_deletion_cancelled():
@@ -248,4 +262,135 @@ def test_deletion_cancelled():
             main()
 
             mock_release_helper.return_value.delete_github_release.assert_not_called()
-            mock_release_helper.return_value.delete_release_tag.assert_not_called()
+            mock_release_helper.return_value.delete_release_tags.assert_not_called()
+
+
+def test_multiple_tag_deletion():
+    repo = "ns-mgmt"
+    tags = ["v1.0.0", "v1.1.0"]
+
+    with patch("src.helpers.git_helper.GitHelper") as mock_git_helper, patch(
+        "src.helpers.release_helper.ReleaseHelper"
+    ) as mock_release_helper, patch("os.path.isdir", return_value=True), patch(
+        "src.delete_release.GitHelper", mock_git_helper
+    ), patch(
+        "src.delete_release.ReleaseHelper", mock_release_helper
+    ):
+        releases = {tag: {"tag_name": tag, "id": i} for i, tag in enumerate(tags)}
+        mock_git_helper.return_value.check_git_repo.return_value = True
+        mock_release_helper.return_value.get_github_release_by_tag.side_effect = releases.get
+        mock_release_helper.return_value.delete_github_release.return_value = True
+        mock_git_helper.return_value.tag_exists.return_value = True
+
+        with patch("sys.argv", ["delete_release.py", "-r", repo, "-t", *tags, "-n"]):
+            main()
+
+            mock_release_helper.assert_called_once()
+            mock_release_helper.return_value.get_releases.assert_not_called()
+            delete_github_release = mock_release_helper.return_value.delete_github_release
+            assert [c.args[0] for c in delete_github_release.call_args_list] == [0, 1]
+            # The confirmed tags are deleted together
+            mock_release_helper.return_value.delete_release_tags.assert_called_once_with(tags)
+            mock_release_helper.return_value.close.assert_called_once()
+
+
+def test_multiple_tag_deletion_past_first_page_of_releases():
+    # GitHub lists releases 30 to a page, so older releases must still be found by tag
+    releases = [{"tag_name": f"v1.{i}.0", "id": i} for i in range(40, 10, -1)]
+    old_release = {"tag_name": "v0.1.0", "id": 1}
+
+    with patch("src.helpers.release_helper.GitHelper"), patch(
+        "src.helpers.release_helper.ConcourseClient"
+    ), patch("src.helpers.release_helper.GitHubClient") as mock_github_client:
+        mock_github = mock_github_client.return_value
+        mock_github.get_releases.return_value = releases
+        mock_github.find_release_by_tag.side_effect = lambda owner, repo, tag: {
+            r["tag_name"]: r for r in releases + [old_release]
+        }.get(tag)
+        release_helper = ReleaseHelper(repo="ns-mgmt", git_dir="/test/git")
+        git_helper = MagicMock()
+        git_helper.tag_exists.return_value = True
+
+        delete_releases(git_helper, release_helper, ["v1.13.0", "v0.1.0"], non_interactive=True)
+
+        deleted_ids = sorted(c.args[2] for c in mock_github.delete_release.call_args_list)
+        assert deleted_ids == [1, 13]
+
+
+def test_multiple_tag_deletion_pushes_once(tmp_path, monkeypatch):
+    for name in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(name, "test")
+    for name in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(name, "test@example.com")
+
+    def git(*args, cwd=tmp_path):
+        subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+    git("init", "--bare", "-q", "origin.git")
+    git("clone", "-q", "origin.git", "ns-mgmt")
+    repo_dir = tmp_path / "ns-mgmt"
+    (repo_dir / "version").write_text("1.0.0\n")
+    git("add", "version", cwd=repo_dir)
+    git("commit", "-q", "-m", "Initial commit", cwd=repo_dir)
+    for tag in ("v1.0.0", "v1.1.0", "v1.2.0"):
+        git("tag", tag, cwd=repo_dir)
+    git("push", "-q", "origin", "HEAD", "--tags", cwd=repo_dir)
+
+    with patch("src.helpers.release_helper.ConcourseClient"), patch(
+        "src.helpers.release_helper.GitHubClient"
+    ) as mock_github_client, patch.object(
+        Remote, "push", autospec=True, side_effect=Remote.push
+    ) as mock_push:
+        mock_github_client.return_value.find_release_by_tag.side_effect = lambda owner, repo, tag: {
+            "tag_name": tag,
+            "id": tag,
+        }
+        release_helper = ReleaseHelper(repo="ns-mgmt", git_dir=str(tmp_path))
+        git_helper = GitHelper(git_dir=str(tmp_path), repo="ns-mgmt")
+
+        delete_releases(git_helper, release_helper, ["v1.0.0", "v1.1.0"], non_interactive=True)
+        release_helper.close()
+        git_helper.close()
+
+    mock_push.assert_called_once()
+    for cwd in (repo_dir, tmp_path / "origin.git"):
+        tags = subprocess.run(
+            ["git", "tag"], cwd=cwd, check=True, capture_output=True, text=True
+        ).stdout.split()
+        assert tags == ["v1.2.0"]
+
+
+def test_import_defers_heavy_helpers():
+    # Argument parsing should not pay for importing GitPython and requests
+    code = "import sys, src.delete_release; print('git' in sys.modules, 'requests' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_commit_sha_skips_github_lookup():
+    repo = "ns-mgmt"
+    sha = "0123456789abcdef0123456789abcdef01234567"
+
+    with patch("src.helpers.git_helper.GitHelper") as mock_git_helper, patch(
+        "src.helpers.release_helper.ReleaseHelper"
+    ) as mock_release_helper, patch("os.path.isdir", return_value=True), patch(
+        "src.delete_release.GitHelper", mock_git_helper
+    ), patch(
+        "src.delete_release.ReleaseHelper", mock_release_helper
+    ):
+        mock_git_helper.return_value.check_git_repo.return_value = True
+        mock_git_helper.return_value.tag_exists.return_value = True
+
+        with patch("sys.argv", ["delete_release.py", "-r", repo, "-t", sha, "-n"]):
+            main()
+
+            mock_release_helper.return_value.get_github_release_by_tag.assert_not_called()
+            mock_release_helper.return_value.get_releases.assert_not_called()
+            mock_release_helper.return_value.delete_github_release.assert_not_called()
+            mock_release_helper.return_value.delete_release_tags.assert_called_once_with([sha])
@@ -0,0 +1,160 @@
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.demo_release_pipeline import DemoReleasePipeline
+
+
+def git(*args, cwd):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo_dir(tmp_path, monkeypatch):
+    """A clone of a bare origin with master, version and release branches and two tags."""
+    for name in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(name, "test")
+    for name in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(name, "test@example.com")
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+
+    git("init", "--bare", "-q", "-b", "master", "origin.git", cwd=tmp_path)
+    git("clone", "-q", "origin.git", "ns-mgmt", cwd=tmp_path)
+    repo_dir = tmp_path / "ns-mgmt"
+    git("checkout", "-q", "-b", "master", cwd=repo_dir)
+    for version in ("1.0.0", "1.1.0"):
+        (repo_dir / "version").write_text(version)
+        git("add", "version", cwd=repo_dir)
+        git("commit", "-q", "-m", f"Release {version}", cwd=repo_dir)
+        git("tag", f"release-v{version}", cwd=repo_dir)
+    git("branch", "version", cwd=repo_dir)
+    git("branch", "release", cwd=repo_dir)
+    git("push", "-q", "origin", "master", "version", "release", "--tags", cwd=repo_dir)
+    return repo_dir
+
+
+@pytest.fixture
+def pipeline(repo_dir):
+    pipeline = DemoReleasePipeline(
+        git_helper=MagicMock(),
+        release_helper=MagicMock(),
+        concourse_client=MagicMock(),
+        foundation="cml-k8s-n-01",
+        repo="ns-mgmt",
+        repo_dir=str(repo_dir),
+        owner="Utilities-tkgieng",
+        branch=None,
+        params_repo="params",
+        params_dir=str(repo_dir.parent / "params"),
+        params_branch="master",
+        release_tag=None,
+        release_body="",
+        release_pipeline="tkgi-ns-mgmt-release",
+        set_pipeline="tkgi-ns-mgmt-set-release-pipeline",
+        mgmt_pipeline="tkgi-ns-mgmt-cml-k8s-n-01",
+    )
+    yield pipeline
+    pipeline.close()
+
+
+@pytest.fixture
+def later_steps(pipeline):
+    """Stub out everything run() does after checking the working tree."""
+    with patch.object(
+        pipeline, "get_latest_release_tag", return_value=None
+    ) as get_latest_release_tag, patch.object(pipeline, "handle_version_reversion"), patch.object(
+        pipeline, "run_release_pipeline"
+    ), patch.object(
+        pipeline, "run_set_pipeline"
+    ), patch.object(
+        pipeline, "refly_pipeline"
+    ), patch(
+        "builtins.input", return_value=""
+    ):
+        yield get_latest_release_tag
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda repo_dir: (repo_dir / "version").write_text("9.9.9"),
+        lambda repo_dir: (repo_dir / "untracked").write_text("new"),
+    ],
+    ids=["modified", "untracked"],
+)
+def test_run_stops_on_dirty_tree(pipeline, repo_dir, later_steps, change):
+    change(repo_dir)
+
+    pipeline.run()
+
+    later_steps.assert_not_called()
+    assert pipeline.branch is None
+
+
+def test_run_detects_current_branch(pipeline, repo_dir, later_steps):
+    git("checkout", "-q", "-b", "feature", cwd=repo_dir)
+
+    pipeline.run()
+
+    later_steps.assert_called_once()
+    assert pipeline.branch == "feature"
+
+
+def test_run_reports_detached_head_as_head(pipeline, repo_dir, later_steps):
+    git("checkout", "-q", "--detach", "release-v1.0.0", cwd=repo_dir)
+
+    pipeline.run()
+
+    later_steps.assert_called_once()
+    assert pipeline.branch == "HEAD"
+
+
+def test_run_keeps_given_branch(pipeline, later_steps):
+    pipeline.branch = "develop"
+
+    pipeline.run()
+
+    later_steps.assert_called_once()
+    assert pipeline.branch == "develop"
+
+
+def test_validate_git_tag(pipeline):
+    assert pipeline.validate_git_tag("1.0.0")
+    assert not pipeline.validate_git_tag("2.0.0")
+    # Both lookups are answered by the same git process
+    assert pipeline._ref_check._proc is not None
+    assert pipeline.validate_git_tag("1.1.0")
+
+
+def test_revert_version_pushes_version_and_release(pipeline, repo_dir):
+    origin = repo_dir.parent / "origin.git"
+    old_release = git("rev-parse", "release", cwd=origin)
+
+    pipeline.revert_version("1.0.0")
+
+    assert git("show", "version:version", cwd=origin) == "1.0.0"
+    assert git("log", "-1", "--format=%s", "version", cwd=origin) == (
+        "Revert version back to 1.0.0 NOTICKET"
+    )
+    # The release branch is recreated from master with the version branch merged in
+    assert git("rev-parse", "release", cwd=origin) == git("rev-parse", "master", cwd=repo_dir)
+    assert git("rev-parse", "release", cwd=origin) != old_release
+    assert git("rev-parse", "--abbrev-ref", "version@{upstream}", cwd=repo_dir) == (
+        "origin/version"
+    )
+
+
+def test_revert_version_push_is_atomic(pipeline, repo_dir):
+    origin = repo_dir.parent / "origin.git"
+    hook = origin / "hooks" / "update"
+    hook.write_text('#!/bin/sh\n[ "$1" != refs/heads/release ]\n')
+    hook.chmod(0o755)
+    old_refs = git("for-each-ref", cwd=origin)
+
+    pipeline.revert_version("1.0.0")
+
+    # The release branch was rejected, so the version branch was not updated either
+    assert git("for-each-ref", cwd=origin) == old_refs
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.helpers.github import GitHubClient
+
+
+def make_response(status_code, headers=None):
+    """Create a mock response with the given status code and headers."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestGitHubClientGet(unittest.TestCase):
+    def setUp(self):
+        """Set up a client whose session is mocked out."""
+        self.client = GitHubClient(api_url="https://github.example.com/api/v3", token="token")
+        self.client.session = MagicMock()
+        self.get = self.client.session.get
+        self.url = "https://github.example.com/api/v3/repos/owner/repo/releases"
+        self.sleep_patcher = patch("src.helpers.github.time.sleep")
+        self.mock_sleep = self.sleep_patcher.start()
+
+    def tearDown(self):
+        self.sleep_patcher.stop()
+
+    def test_not_modified_returns_cached_response(self):
+        """Test that a 304 is answered with the response cached for the ETag."""
+        cached = make_response(200, {"ETag": '"abc"'})
+        self.get.side_effect = [cached, make_response(304)]
+
+        self.assertIs(self.client._get(self.url, params={"per_page": 30}), cached)
+        self.assertIs(self.client._get(self.url, params={"per_page": 30}), cached)
+        self.assertEqual(self.get.call_args.kwargs["headers"], {"If-None-Match": '"abc"'})
+
+    def test_retry_after_is_honoured(self):
+        """Test that a rate-limited request waits as long as Retry-After asks for."""
+        ok = make_response(200)
+        self.get.side_effect = [make_response(429, {"Retry-After": "3"}), ok]
+
+        self.assertIs(self.client._get(self.url), ok)
+        self.mock_sleep.assert_called_once_with(3.0)
+
+    def test_plain_forbidden_is_not_retried(self):
+        """Test that a 403 that is not a rate limit is returned straight away."""
+        forbidden = make_response(403, {"X-RateLimit-Remaining": "42"})
+        self.get.return_value = forbidden
+
+        self.assertIs(self.client._get(self.url), forbidden)
+        self.get.assert_called_once()
+        self.mock_sleep.assert_not_called()
+
+    def test_distant_rate_limit_reset_is_not_waited_for(self):
+        """Test that a rate limit resetting after max_backoff is given up on at once."""
+        reset = str(int(time.time()) + 10 * self.client.max_backoff)
+        limited = make_response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+        self.get.return_value = limited
+
+        self.assertIs(self.client._get(self.url), limited)
+        self.get.assert_called_once()
+        self.mock_sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
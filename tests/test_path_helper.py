@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from src.helpers.path_helper import RepositoryPathHelper
+
+
+@pytest.mark.parametrize(
+    "owner,expected",
+    [
+        (
+            "Utilities-tkgieng",
+            (
+                "tkgi-ns-mgmt-release",
+                "tkgi-ns-mgmt-cml-k8s-n-01-set-release-pipeline",
+                "tkgi-ns-mgmt-cml-k8s-n-01",
+            ),
+        ),
+        (
+            "bob",
+            (
+                "tkgi-ns-mgmt-bob-release",
+                "tkgi-ns-mgmt-bob-cml-k8s-n-01-set-release-pipeline",
+                "tkgi-ns-mgmt-bob-cml-k8s-n-01",
+            ),
+        ),
+    ],
+)
+def test_pipeline_names(owner, expected):
+    path_helper = RepositoryPathHelper(git_dir="/git", owner=owner)
+    assert path_helper.pipeline_names("ns-mgmt", "cml-k8s-n-01") == expected
+
+
+@pytest.mark.parametrize(
+    "owner,name,expected_dir",
+    [
+        # Other owners' clones have the owner appended
+        ("bob", "repobob", "repobob-bob"),
+        ("bob", "repo", "repo-bob"),
+        # Only a dashed owner suffix is stripped for the default owner
+        ("Utilities-tkgieng", "repo-Utilities-tkgieng", "repo"),
+        ("Utilities-tkgieng", "repoUtilities-tkgieng", "repoUtilities-tkgieng"),
+        ("Utilities-tkgieng", "repo", "repo"),
+    ],
+)
+def test_adjust_path(tmp_path, owner, name, expected_dir):
+    (tmp_path / expected_dir).mkdir()
+    path_helper = RepositoryPathHelper(git_dir=str(tmp_path), owner=owner)
+    assert path_helper.adjust_path(name) == (name, os.path.join(tmp_path, expected_dir))
+
+
+def test_adjust_path_missing_directory(tmp_path):
+    path_helper = RepositoryPathHelper(git_dir=str(tmp_path))
+    with pytest.raises(ValueError, match="Could not find repo directory"):
+        path_helper.adjust_path("repo")
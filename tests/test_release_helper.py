@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 
+import os
 import subprocess
+import tempfile
 import unittest
 from unittest.mock import MagicMock, call, patch
 
+import requests
+
 # Using import from package
+from src.helpers.git_helper import GitHelper
 from src.helpers.release_helper import ReleaseHelper
 
 
@@ -178,5 +183,155 @@ class TestReleaseHelper(unittest.TestCase):
         )
 
 
+class TestReleaseHelperGitHub(unittest.TestCase):
+    def setUp(self):
+        """Set up a helper with GitHub, git and Concourse access mocked out."""
+        self.patchers = [
+            patch("src.helpers.release_helper.GitHelper"),
+            patch("src.helpers.release_helper.logger"),
+            patch("src.helpers.release_helper.GitHubClient"),
+            patch("src.helpers.release_helper.ConcourseClient"),
+        ]
+        mock_git_helper, self.mock_logger, mock_github_client, _ = (
+            p.start() for p in self.patchers
+        )
+        mock_git_helper.return_value.check_git_repo.return_value = True
+        self.mock_github = mock_github_client.return_value
+        self.mock_github.get_releases.return_value = [
+            {"tag_name": "release-v1.0.0", "id": 1},
+            {"tag_name": "release-v1.1.0", "id": 2},
+        ]
+        self.mock_github.find_release_by_tag.return_value = None
+
+        self.helper = ReleaseHelper(
+            repo="test-repo",
+            owner="test-owner",
+            git_dir="/test/git",
+            repo_dir="/test/repo",
+            params_dir="/test/params",
+        )
+
+    def tearDown(self):
+        for p in self.patchers:
+            p.stop()
+
+    def test_get_releases_is_cached(self):
+        """Test that releases are only fetched from GitHub once."""
+        self.assertEqual(self.helper.get_releases(), self.helper.get_releases())
+        self.mock_github.get_releases.assert_called_once_with("test-owner", "test-repo")
+
+    def test_get_github_release_by_tag_uses_tag_endpoint(self):
+        """Test that a tag lookup does not list every release."""
+        self.mock_github.find_release_by_tag.return_value = {"tag_name": "release-v1.1.0"}
+        release = self.helper.get_github_release_by_tag("release-v1.1.0")
+        self.assertEqual(release["tag_name"], "release-v1.1.0")
+        self.mock_github.find_release_by_tag.assert_called_once_with(
+            "test-owner", "test-repo", "release-v1.1.0"
+        )
+        self.mock_github.get_releases.assert_not_called()
+
+    def test_get_github_release_by_tag_reuses_release_list(self):
+        """Test that tag lookups are served from an already fetched release list."""
+        self.helper.get_releases()
+        release = self.helper.get_github_release_by_tag("release-v1.1.0")
+        self.assertEqual(release["id"], 2)
+        self.mock_github.get_releases.assert_called_once()
+        self.mock_github.find_release_by_tag.assert_not_called()
+
+    def test_get_github_release_by_tag_falls_back_past_release_list(self):
+        """Test that a tag missing from the fetched release list is asked for directly."""
+        self.helper.get_releases()
+        self.mock_github.find_release_by_tag.return_value = {"tag_name": "release-v0.1.0", "id": 3}
+        release = self.helper.get_github_release_by_tag("release-v0.1.0")
+        self.assertEqual(release["id"], 3)
+        self.mock_github.find_release_by_tag.assert_called_once_with(
+            "test-owner", "test-repo", "release-v0.1.0"
+        )
+
+    def test_get_github_release_by_tag_finds_draft_in_release_list(self):
+        """Test that a draft release, which the tag endpoint does not serve, is still found."""
+        draft = {"tag_name": "release-v1.2.0", "id": 3, "draft": True}
+        self.mock_github.get_releases.return_value.insert(0, draft)
+        self.assertEqual(self.helper.get_github_release_by_tag("release-v1.2.0"), draft)
+        self.mock_github.find_release_by_tag.assert_called_once()
+        self.assertIsNone(self.helper.get_github_release_by_tag("release-v9.9.9"))
+        self.mock_github.get_releases.assert_called_once()
+
+    def test_find_github_release_by_tag_raises_on_error(self):
+        """Test that a failed lookup is told apart from a missing release."""
+        self.mock_github.find_release_by_tag.side_effect = requests.exceptions.ConnectionError
+        with self.assertRaises(requests.exceptions.RequestException):
+            self.helper.find_github_release_by_tag("release-v1.2.0")
+        self.assertIsNone(self.helper.get_github_release_by_tag("release-v1.2.0"))
+        self.mock_logger.error.assert_called_once()
+
+    def test_delete_github_release_updates_cache(self):
+        """Test that a deleted release is dropped from the cached release list."""
+        self.helper.get_releases()
+        self.assertTrue(self.helper.delete_github_release(1))
+        self.assertIsNone(self.helper.get_github_release_by_tag("release-v1.0.0"))
+        self.assertEqual(self.helper.get_releases(), [{"tag_name": "release-v1.1.0", "id": 2}])
+        self.mock_github.get_releases.assert_called_once()
+
+
+class TestReleaseHelperParamsTags(unittest.TestCase):
+    def setUp(self):
+        """Set up a workspace with the default owner's and another owner's params clones."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.git_dir = self.tmp.name
+        env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME="test",
+            GIT_AUTHOR_EMAIL="test@example.com",
+            GIT_COMMITTER_NAME="test",
+            GIT_COMMITTER_EMAIL="test@example.com",
+        )
+        for name, tag in (
+            ("ns-mgmt-bob", None),
+            ("params", "ns-mgmt-release-v1.0.0"),
+            ("params-bob", "ns-mgmt-release-v1.1.0"),
+        ):
+            repo_dir = os.path.join(self.git_dir, name)
+            subprocess.run(["git", "init", "-q", repo_dir], check=True, env=env)
+            subprocess.run(
+                ["git", "-C", repo_dir, "commit", "-q", "--allow-empty", "-m", "Initial commit"],
+                check=True,
+                env=env,
+            )
+            if tag:
+                subprocess.run(["git", "-C", repo_dir, "tag", tag], check=True, env=env)
+
+        self.patchers = [
+            # Other tests may have left GitHelper patched, so use the real one explicitly
+            patch("src.helpers.release_helper.GitHelper", GitHelper),
+            patch("src.helpers.release_helper.logger"),
+            patch("src.helpers.release_helper.GitHubClient"),
+            patch("src.helpers.release_helper.ConcourseClient"),
+        ]
+        for p in self.patchers:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patchers:
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_params_tags_come_from_owner_params_clone(self):
+        """Test that another owner's params tags are read from its params-<owner> clone."""
+        helper = ReleaseHelper(
+            repo="ns-mgmt",
+            git_dir=self.git_dir,
+            owner="bob",
+            repo_dir=os.path.join(self.git_dir, "ns-mgmt-bob"),
+            params_dir=os.path.join(self.git_dir, "params-bob"),
+        )
+        try:
+            self.assertEqual(helper.get_params_release_tags(), ["ns-mgmt-release-v1.1.0"])
+            self.assertTrue(helper.validate_params_release_tag("ns-mgmt-release-v1.1.0"))
+            self.assertFalse(helper.validate_params_release_tag("ns-mgmt-release-v1.0.0"))
+        finally:
+            helper.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,71 +7,7 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src.rollback_release import parse_args
-
-
-# Create an undecorated version of the main function for testing
-def main_test_function():
-    """
-    This is a copy of the main function without the wrapper for testing purposes.
-    Must be kept in sync with the original in src/rollback_release.py
-    """
-    import os
-    import subprocess
-
-    from src.rollback_release import GitHelper, ReleaseHelper
-
-    args = parse_args()
-    repo = "ns-mgmt"
-    params_repo = args.params_repo
-
-    if args.owner != "Utilities-tkgieng":
-        repo = f"{repo}-{args.owner}"
-        params_repo = f"{args.params_repo}-{args.owner}"
-
-    # Initialize helpers
-    git_helper = GitHelper(repo=repo)
-    if not git_helper.check_git_repo():
-        raise ValueError(f"Git repository {repo} not found or not a valid Git repository")
-
-    release_helper = ReleaseHelper(repo=repo, owner=args.owner, params_repo=params_repo)
-
-    # Change to the repo's ci directory
-    ci_dir = os.path.expanduser(f"~/git/{repo}/ci")
-    if not os.path.exists(ci_dir):
-        raise ValueError(f"CI directory not found at {ci_dir}")
-
-    os.chdir(ci_dir)
-
-    # Validate release tag
-    release_tag = f"{repo}-{args.release}"
-    if not release_helper.validate_params_release_tag(release_tag):
-        release_helper.print_valid_params_release_tags()
-        raise ValueError(
-            f"Release [-r {args.release}] must be a valid release tagged on the params repo"
-        )
-
-    # Run set pipeline
-    if not release_helper.run_set_pipeline(args.foundation):
-        raise ValueError("Failed to run set pipeline")
-
-    # Ask user if they want to run the pipeline
-    user_input = input(f"Do you want to run the tkgi-{repo}-{args.foundation} pipeline? [yN] ")
-    if user_input.lower().startswith("y"):
-        try:
-            subprocess.run(
-                [
-                    "fly",
-                    "-t",
-                    args.foundation,
-                    "trigger-job",
-                    f"tkgi-{repo}-{args.foundation}/prepare-kustomizations",
-                    "-w",
-                ],
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
-            raise ValueError(f"Failed to trigger pipeline job: {e}") from e
+from src.rollback_release import main, parse_args
 
 
 def test_parse_args():
@@ -125,9 +61,7 @@ def test_custom_help_formatter():
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
 def test_main_ci_dir_not_found(
-    mock_chdir,
     mock_expanduser,
     mock_exists,
     mock_release_helper,
@@ -144,22 +78,17 @@ def test_main_ci_dir_not_found(
     # Run with required arguments
     with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
         with pytest.raises(ValueError) as excinfo:
-            main_test_function()
+            main.__wrapped__()
 
         # Verify the error message
         assert "CI directory not found" in str(excinfo.value)
 
-    # Verify chdir was not called
-    mock_chdir.assert_not_called()
-
 
 @patch("src.rollback_release.GitHelper")
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
 def test_main_invalid_release_tag(
-    mock_chdir,
     mock_expanduser,
     mock_exists,
     mock_release_helper,
@@ -177,12 +106,17 @@ def test_main_invalid_release_tag(
     mock_release_helper.return_value.validate_params_release_tag.return_value = False
 
     # Run with required arguments
-    with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
+    with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]), patch(
+        "src.rollback_release.logger"
+    ) as mock_logger:
         with pytest.raises(ValueError) as excinfo:
-            main_test_function()
+            main.__wrapped__()
 
         # Verify the error message
-        assert "must be a valid release tagged on the params repo" in str(excinfo.value)
+        assert "Invalid release tag: v1.0.0" in str(excinfo.value)
+        mock_logger.error.assert_called_once_with(
+            "Release [-r v1.0.0] must be a valid release tagged on the params repo"
+        )
 
     # Verify method was called
     mock_release_helper.return_value.validate_params_release_tag.assert_called_once_with(
@@ -196,9 +130,7 @@ def test_main_invalid_release_tag(
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
 def test_main_set_pipeline_fails(
-    mock_chdir,
     mock_expanduser,
     mock_exists,
     mock_release_helper,
@@ -219,7 +151,7 @@ def test_main_set_pipeline_fails(
     # Run with required arguments
     with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
         with pytest.raises(ValueError) as excinfo:
-            main_test_function()
+            main.__wrapped__()
 
         # Verify the error message
         assert "Failed to run set pipeline" in str(excinfo.value)
@@ -232,13 +164,11 @@ def test_main_set_pipeline_fails(
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
 @patch("builtins.input")
 @patch("subprocess.run")
 def test_main_trigger_pipeline_user_accepts(
     mock_subprocess_run,
     mock_input,
-    mock_chdir,
     mock_expanduser,
     mock_exists,
     mock_release_helper,
@@ -261,7 +191,7 @@ def test_main_trigger_pipeline_user_accepts(
 
     # Run with required arguments
     with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
-        main_test_function()
+        main.__wrapped__()
 
     # Verify trigger job was called
     mock_subprocess_run.assert_called_once_with(
@@ -281,13 +211,11 @@ def test_main_trigger_pipeline_user_accepts(
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
 @patch("builtins.input")
 @patch("subprocess.run")
 def test_main_trigger_pipeline_user_declines(
     mock_subprocess_run,
     mock_input,
-    mock_chdir,
     mock_expanduser,
     mock_exists,
     mock_release_helper,
@@ -310,7 +238,7 @@ def test_main_trigger_pipeline_user_declines(
 
     # Run with required arguments
     with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
-        main_test_function()
+        main.__wrapped__()
 
     # Verify trigger job was not called
     mock_subprocess_run.assert_not_called()
@@ -320,13 +248,11 @@ def test_main_trigger_pipeline_user_declines(
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
 @patch("builtins.input")
 @patch("subprocess.run")
 def test_main_trigger_pipeline_subprocess_error(
     mock_subprocess_run,
     mock_input,
-    mock_chdir,
     mock_expanduser,
     mock_exists,
     mock_release_helper,
@@ -353,7 +279,7 @@ def test_main_trigger_pipeline_subprocess_error(
     # Run with required arguments
     with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
         with pytest.raises(ValueError) as excinfo:
-            main_test_function()
+            main.__wrapped__()
 
         # Verify the error message
         assert "Failed to trigger pipeline job" in str(excinfo.value)
@@ -372,7 +298,7 @@ def test_main_unexpected_error(mock_exists, mock_release_helper, mock_git_helper
     # Run with required arguments
     with patch("sys.argv", ["rollback_release.py", "-f", "foundation1", "-r", "v1.0.0"]):
         with pytest.raises(Exception) as excinfo:
-            main_test_function()
+            main.__wrapped__()
 
         # Verify it's our test error that was raised
         assert "Unexpected test error" in str(excinfo.value)
@@ -382,10 +308,7 @@ def test_main_unexpected_error(mock_exists, mock_release_helper, mock_git_helper
 @patch("src.rollback_release.ReleaseHelper")
 @patch("os.path.exists")
 @patch("os.path.expanduser")
-@patch("os.chdir")
-def test_main_with_custom_owner(
-    mock_chdir, mock_expanduser, mock_exists, mock_release_helper, mock_git_helper
-):
+def test_main_with_custom_owner(mock_expanduser, mock_exists, mock_release_helper, mock_git_helper):
     # Setup mocks
     mock_git_helper.return_value.check_git_repo.return_value = True
     mock_exists.return_value = True
@@ -405,7 +328,7 @@ def test_main_with_custom_owner(
     ):
         # Mock user input to decline running pipeline
         with patch("builtins.input", return_value="no"):
-            main_test_function()
+            main.__wrapped__()
 
     # Verify GitHelper was initialized with the correct repo
     mock_git_helper.assert_called_once_with(repo="ns-mgmt-custom-owner")
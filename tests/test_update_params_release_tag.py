@@ -6,49 +6,7 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src.update_params_release_tag import parse_args
-
-
-# Create an undecorated version of the main function for testing
-def main_test_function():
-    """
-    This is a copy of the main function without the wrapper for testing purposes.
-    Must be kept in sync with the original in src/update_params_release_tag.py
-    """
-    import os
-
-    from src.helpers.path_helper import RepositoryPathHelper
-    from src.update_params_release_tag import ReleaseHelper
-
-    args = parse_args()
-
-    repo = args.repo
-    params_repo = args.params_repo
-    owner = args.owner
-    git_dir = "/home/user/git"  # For testing, use a fixed path
-
-    if not os.path.isdir(git_dir):
-        raise ValueError(f"Could not find git directory: {git_dir}")
-    if not os.path.isdir(os.path.join(git_dir, repo)):
-        raise ValueError(f"Could not find repo directory: {git_dir}/{repo}")
-
-    repo_dir = os.path.join(git_dir, repo)
-    params_dir = os.path.join(git_dir, params_repo)
-    path_helper = RepositoryPathHelper(git_dir=git_dir, owner=owner)
-    repo, repo_dir, params_repo, params_dir = path_helper.adjust_paths(repo, params_repo)
-
-    # Initialize helpers
-    release_helper = ReleaseHelper(
-        repo=repo,
-        repo_dir=repo_dir,
-        owner=owner,
-        params_dir=params_dir,
-        params_repo=params_repo,
-    )
-    os.chdir(repo_dir)
-
-    if not release_helper.update_params_git_release_tag("v"):
-        raise ValueError("Failed to update git release tag")
+from src.update_params_release_tag import main, parse_args
 
 
 def test_parse_args():
@@ -103,88 +61,70 @@ def test_custom_help_formatter():
         assert "usage:" not in result
 
 
-@patch("os.path.isdir")
-def test_main_repo_dir_not_found(mock_isdir):
-    # Setup mocks - first call for git_dir, second call for repo_dir
-    mock_isdir.side_effect = [True, False]
+def run_main(git_dir, *args):
+    """Run the undecorated main against git_dir, so errors are raised."""
+    argv = ["update_params_release_tag.py", "-w", str(git_dir), *args]
+    with patch("sys.argv", argv), patch("src.update_params_release_tag.logger"):
+        main.__wrapped__()
 
-    # Run with required arguments
-    with patch("sys.argv", ["update_params_release_tag.py", "-r", "test-repo"]):
-        with pytest.raises(ValueError) as excinfo:
-            main_test_function()
 
-        # Verify error message
-        assert "Could not find repo directory" in str(excinfo.value)
+@pytest.fixture
+def workspace(tmp_path):
+    """Create a git workspace with a repo and a params repo."""
+    (tmp_path / "test-repo").mkdir()
+    (tmp_path / "params").mkdir()
+    return tmp_path
 
 
-@patch("os.path.isdir")
-@patch("os.chdir")
-@patch("src.update_params_release_tag.ReleaseHelper")
-def test_main_not_git_repo(mock_release_helper, mock_chdir, mock_isdir):
-    # Setup mocks - first call for git_dir, second call for repo_dir
-    mock_isdir.side_effect = [False, True]
+@pytest.fixture
+def mock_release_helper():
+    with patch("src.update_params_release_tag.ReleaseHelper") as mock_release_helper:
+        mock_release_helper.return_value.update_params_git_release_tag.return_value = True
+        yield mock_release_helper
 
-    # Run with required arguments
-    with patch("sys.argv", ["update_params_release_tag.py", "-r", "test-repo"]):
-        with pytest.raises(ValueError) as excinfo:
-            main_test_function()
-
-        # Verify error message
-        assert "Could not find git directory: /home/user/git" in str(excinfo.value)
-
-        # Verify release_helper.update_params_git_release_tag wasn't called
-        mock_release_helper.return_value.update_params_git_release_tag.assert_not_called()
-
-
-@patch("os.path.isdir")
-@patch("os.chdir")
-@patch("src.update_params_release_tag.ReleaseHelper")
-@patch("src.helpers.path_helper.RepositoryPathHelper")
-def test_main_update_tag_fails(mock_path_helper, mock_release_helper, mock_chdir, mock_isdir):
-    # Setup mocks
-    mock_isdir.return_value = True
-    mock_path_helper.return_value.adjust_paths.return_value = (
-        "test-repo",
-        "/home/user/git/test-repo",
-        "params",
-        "/home/user/git/params"
-    )
+
+def test_main_repo_dir_not_found(tmp_path, mock_release_helper):
+    with pytest.raises(ValueError) as excinfo:
+        run_main(tmp_path, "-r", "test-repo")
+
+    # Verify error message
+    assert "Could not find repo directory" in str(excinfo.value)
+    mock_release_helper.assert_not_called()
+
+
+def test_main_git_dir_not_found(tmp_path, mock_release_helper):
+    git_dir = tmp_path / "missing"
+
+    with pytest.raises(ValueError) as excinfo:
+        run_main(git_dir, "-r", "test-repo")
+
+    # Verify error message
+    assert f"Could not find git directory: {git_dir}" in str(excinfo.value)
+
+    # Verify release_helper.update_params_git_release_tag wasn't called
+    mock_release_helper.return_value.update_params_git_release_tag.assert_not_called()
+
+
+def test_main_update_tag_fails(workspace, mock_release_helper):
     mock_release_helper.return_value.update_params_git_release_tag.return_value = False
 
-    # Run with required arguments
-    with patch("sys.argv", ["update_params_release_tag.py", "-r", "test-repo"]):
-        with pytest.raises(ValueError) as excinfo:
-            main_test_function()
-
-        # Verify error message
-        assert "Failed to update git release tag" in str(excinfo.value)
-
-
-@patch("os.path.isdir")
-@patch("os.chdir")
-@patch("src.update_params_release_tag.ReleaseHelper")
-@patch("src.helpers.path_helper.RepositoryPathHelper")
-def test_main_success(mock_path_helper, mock_release_helper, mock_chdir, mock_isdir):
-    # Setup mocks
-    mock_isdir.return_value = True
-    mock_path_helper.return_value.adjust_paths.return_value = (
-        "test-repo",
-        "/home/user/git/test-repo",
-        "params",
-        "/home/user/git/params"
-    )
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
+    with pytest.raises(ValueError) as excinfo:
+        run_main(workspace, "-r", "test-repo")
 
-    # Run with required arguments
-    with patch("sys.argv", ["update_params_release_tag.py", "-r", "test-repo"]):
-        main_test_function()
+    # Verify error message
+    assert "Failed to update git release tag" in str(excinfo.value)
+
+
+def test_main_success(workspace, mock_release_helper):
+    run_main(workspace, "-r", "test-repo")
 
     # Verify ReleaseHelper was initialized correctly
     mock_release_helper.assert_called_once_with(
         repo="test-repo",
-        repo_dir="/home/user/git/test-repo",
+        git_dir=str(workspace),
+        repo_dir=os.path.join(workspace, "test-repo"),
         owner="Utilities-tkgieng",
-        params_dir="/home/user/git/params",
+        params_dir=os.path.join(workspace, "params"),
         params_repo="params",
     )
 
@@ -192,96 +132,48 @@ def test_main_success(mock_path_helper, mock_release_helper, mock_chdir, mock_is
     mock_release_helper.return_value.update_params_git_release_tag.assert_called_once_with("v")
 
 
-@patch("os.path.isdir")
-@patch("os.chdir")
-@patch("src.update_params_release_tag.ReleaseHelper")
-@patch("src.helpers.path_helper.RepositoryPathHelper")
-def test_main_with_custom_owner(mock_path_helper, mock_release_helper, mock_chdir, mock_isdir):
-    # Setup mocks
-    mock_isdir.return_value = True
-    mock_path_helper.return_value.adjust_paths.return_value = (
-        "test-repo",
-        "/home/user/git/test-repo-custom-owner",
-        "params",
-        "/home/user/git/params-custom-owner"
-    )
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
+def test_main_with_custom_owner(workspace, mock_release_helper):
+    (workspace / "test-repo-custom-owner").mkdir()
+    (workspace / "params-custom-owner").mkdir()
 
-    # Run with custom owner
-    with patch(
-        "sys.argv", ["update_params_release_tag.py", "-r", "test-repo", "-o", "custom-owner"]
-    ):
-        main_test_function()
+    run_main(workspace, "-r", "test-repo", "-o", "custom-owner")
 
-    # Verify ReleaseHelper was initialized with correct params
+    # Verify ReleaseHelper was initialized with the other owner's clones
     mock_release_helper.assert_called_once_with(
         repo="test-repo",
-        repo_dir="/home/user/git/test-repo-custom-owner",
+        git_dir=str(workspace),
+        repo_dir=os.path.join(workspace, "test-repo-custom-owner"),
         owner="custom-owner",
-        params_dir="/home/user/git/params-custom-owner",
+        params_dir=os.path.join(workspace, "params-custom-owner"),
         params_repo="params",
     )
 
 
-@patch("os.path.isdir")
-@patch("os.chdir")
-@patch("src.update_params_release_tag.ReleaseHelper")
-@patch("src.helpers.path_helper.RepositoryPathHelper")
-def test_main_repo_ending_with_owner(mock_path_helper, mock_release_helper, mock_chdir, mock_isdir):
-    # Setup mocks
-    mock_isdir.return_value = True
-    mock_path_helper.return_value.adjust_paths.return_value = (
-        "test-repo",
-        "/home/user/git/test-repo",
-        "params",
-        "/home/user/git/params"
-    )
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
+def test_main_repo_ending_with_owner(workspace, mock_release_helper):
+    (workspace / "test-repo-Utilities-tkgieng").mkdir()
 
-    # Run with repo that ends with owner
-    with patch("sys.argv", ["update_params_release_tag.py", "-r", "test-repo-Utilities-tkgieng"]):
-        main_test_function()
+    run_main(workspace, "-r", "test-repo-Utilities-tkgieng")
 
-    # Verify ReleaseHelper was initialized correctly
+    # The name is kept, but the owner is dropped from the directory
     mock_release_helper.assert_called_once_with(
-        repo="test-repo",
-        repo_dir="/home/user/git/test-repo",
+        repo="test-repo-Utilities-tkgieng",
+        git_dir=str(workspace),
+        repo_dir=os.path.join(workspace, "test-repo"),
         owner="Utilities-tkgieng",
-        params_dir="/home/user/git/params",
+        params_dir=os.path.join(workspace, "params"),
         params_repo="params",
     )
 
 
-@patch("os.path.isdir")
-@patch("os.chdir")
-@patch("src.update_params_release_tag.ReleaseHelper")
-@patch("src.helpers.path_helper.RepositoryPathHelper")
-def test_main_params_repo_ending_with_owner(
-    mock_path_helper, mock_release_helper, mock_chdir, mock_isdir
-):
-    # Setup mocks
-    mock_isdir.return_value = True
-    mock_path_helper.return_value.adjust_paths.return_value = (
-        "test-repo",
-        "/home/user/git/test-repo",
-        "params-Utilities-tkgieng",
-        "/home/user/git/params-Utilities-tkgieng"
-    )
-    mock_release_helper.return_value.update_params_git_release_tag.return_value = True
-
-    # Run with params repo that ends with owner
-    with patch(
-        "sys.argv",
-        ["update_params_release_tag.py", "-r", "test-repo", "-p", "params-Utilities-tkgieng"],
-    ):
-        main_test_function()
+def test_main_params_repo_ending_with_owner(workspace, mock_release_helper):
+    run_main(workspace, "-r", "test-repo", "-p", "params-Utilities-tkgieng")
 
-    # Verify ReleaseHelper was initialized with correct params
-    # The actual implementation retains the full params repo name
+    # The params repo name is kept, but the owner is dropped from its directory
     mock_release_helper.assert_called_once_with(
         repo="test-repo",
-        repo_dir="/home/user/git/test-repo",
+        git_dir=str(workspace),
+        repo_dir=os.path.join(workspace, "test-repo"),
         owner="Utilities-tkgieng",
-        params_dir="/home/user/git/params-Utilities-tkgieng",
+        params_dir=os.path.join(workspace, "params"),
         params_repo="params-Utilities-tkgieng",
     )